@@ -2,42 +2,177 @@
 
 from __future__ import annotations
 
+import itertools
+import warnings
+import zlib
 from abc import ABC
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+import httpx
+
+if TYPE_CHECKING:
+    from dataup.models.evaluations import FrameData
+    from dataup.models.inference import InferenceRequest
+
+# Use orjson for plain JSON decoding when the optional dependency is installed
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+    _orjson_dumps: Callable[[Any], bytes] | None = orjson.dumps
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+    _orjson_dumps = None
 
 DEFAULT_BASE_URL = "https://api.data-up.io"
 DEFAULT_TIMEOUT = 30.0
 API_VERSION = "v1"
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+# Request bodies smaller than this are sent uncompressed even when gzip is enabled
+GZIP_MIN_SIZE = 4096
+
+
+def _enum_value(value: Any) -> Any:
+    """Return the underlying value of an enum member, or the value unchanged."""
+    return value.value if isinstance(value, Enum) else value
+
+
+@lru_cache(maxsize=32)
+def _validate_and_prep(api_key: str) -> dict[str, str]:
+    """Validate API key format (key_id.key_secret) and build the default headers.
+
+    Cached per key so clients repeatedly built with the same key share one
+    headers dict. The returned dict must not be mutated.
+    """
+    if not api_key or "." not in api_key:
+        raise ValueError("Invalid API key format. Expected: 'key_id.key_secret'")
+    return {
+        "X-API-Key": api_key,
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+def _inference_request_json(request: InferenceRequest) -> bytes:
+    """Serialize an inference request body.
+
+    Requests carrying base64 images are encoded with orjson when it is
+    installed: its string escaping is markedly faster than pydantic's on
+    multi-megabyte payloads. Small URL-only requests stay on pydantic.
+    """
+    if request.images_b64 and _orjson_dumps is not None:
+        # JSON mode converts values orjson can't encode (Decimal, set, bytes)
+        # the way pydantic would; integers wider than 64 bits still fall back
+        try:
+            return _orjson_dumps(request.model_dump(mode="json", exclude_unset=True))
+        except TypeError:
+            pass
+    return request.model_dump_json(exclude_unset=True).encode()
+
+
+def _iter_frames_json(frames: Iterable[FrameData], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Serialize frames as a batch JSON body incrementally, one frame at a time.
+
+    Frames are coalesced into chunks of roughly ``chunk_size`` bytes so large
+    batches are never held in memory as a single encoded string. ``frames``
+    may be a lazy iterable; it is consumed as the body is sent.
+    """
+    buffer = bytearray(b'{"frames":[')
+    for i, frame in enumerate(frames):
+        if i:
+            buffer += b","
+        buffer += frame.model_dump_json(exclude_unset=True).encode()
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+def _gzip_chunks(chunks: Iterable[bytes], level: int = 1) -> Iterator[bytes]:
+    """Gzip-compress a stream of body chunks incrementally.
+
+    Level 1 keeps compression far cheaper than the upload it saves while
+    still shrinking repetitive label JSON several times over.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _gzip_batch_chunks(chunks: Iterator[bytes]) -> tuple[Iterator[bytes], dict[str, str] | None]:
+    """Gzip a streamed batch body unless it is shorter than ``GZIP_MIN_SIZE``.
+
+    The batch serializers only yield a short chunk at the end of the body, so
+    a short first chunk means the whole body is small. Returns the chunks to
+    send and the headers to send them with.
+    """
+    first = next(chunks, b"")
+    chunks = itertools.chain((first,), chunks)
+    if len(first) < GZIP_MIN_SIZE:
+        return chunks, None
+    return _gzip_chunks(chunks), {"Content-Encoding": "gzip"}
+
+
+def _warn_unclosed(client: object) -> None:
+    """Warn with a ResourceWarning when an open client is garbage collected.
+
+    Clients are meant to be long-lived; one built per call and dropped
+    without being closed throws away its pooled connections and TLS sessions.
+    """
+    if not getattr(client, "_closed", True):
+        name = type(client).__name__
+        opener = "async with" if hasattr(client, "__aenter__") else "with"
+        warnings.warn(
+            f"Unclosed {name}. Reuse one client and close it, "
+            f"e.g. with `{opener} {name}(...) as client:`.",
+            ResourceWarning,
+            source=client,
+            stacklevel=3,
+        )
 
 
 class BaseClient(ABC):
     """Abstract base class for DataUp API clients."""
 
+    __slots__ = ("api_key", "base_url", "timeout", "gzip_batches", "_url_prefix", "_headers_cached")
+
     def __init__(
         self,
         api_key: str,
         *,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
+        gzip_batches: bool = False,
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._validate_api_key()
+        # Only enable against API deployments that accept gzip request bodies
+        self.gzip_batches = gzip_batches
+        self._url_prefix = f"{self.base_url}/api/{API_VERSION}"
+        # Headers never change after construction, so build them once
+        self._headers_cached = _validate_and_prep(api_key)
 
-    def _validate_api_key(self) -> None:
-        """Validate API key format (key_id.key_secret)."""
-        if not self.api_key or "." not in self.api_key:
-            raise ValueError("Invalid API key format. Expected: 'key_id.key_secret'")
+    def __del__(self) -> None:
+        _warn_unclosed(self)
 
     @property
     def _headers(self) -> dict[str, str]:
         """Get default headers for requests."""
-        return {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        return self._headers_cached
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
-        return f"{self.base_url}/api/{API_VERSION}{path}"
+        return self._url_prefix + path
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
 
 if TYPE_CHECKING:
@@ -30,14 +31,14 @@ def paginate(
             print(agent.name)
         ```
     """
-    cursor = None
+    cursor: str | None = None
     while True:
         page = fetch_page(cursor=cursor, **kwargs)
-        yield from page.items
-        if not page.has_next():
-            break
         # Use cursor if available, otherwise use next_page
         cursor = page.cursor or page.next_page
+        yield from page.items
+        if cursor is None:
+            break
 
 
 async def paginate_async(
@@ -47,6 +48,9 @@ async def paginate_async(
     """
     Async iterate through all pages of a paginated endpoint.
 
+    The next page is requested in the background while the items of the
+    current page are being consumed, hiding one round-trip per page.
+
     Args:
         fetch_page: An async function that fetches a page of results.
         **kwargs: Additional arguments to pass to fetch_page.
@@ -60,12 +64,25 @@ async def paginate_async(
             print(agent.name)
         ```
     """
-    cursor = None
-    while True:
-        page = await fetch_page(cursor=cursor, **kwargs)
-        for item in page.items:
-            yield item
-        if not page.has_next():
-            break
-        # Use cursor if available, otherwise use next_page
-        cursor = page.cursor or page.next_page
+    page = await fetch_page(cursor=None, **kwargs)
+    next_task: asyncio.Future[CursorPage[T]] | None = None
+    try:
+        while True:
+            # Resolve everything needed from the page once, before yielding
+            items = page.items
+            # Use cursor if available, otherwise use next_page
+            cursor = page.cursor or page.next_page
+            if cursor is not None:
+                next_task = asyncio.ensure_future(fetch_page(cursor=cursor, **kwargs))
+            else:
+                next_task = None
+            for item in items:
+                yield item
+            if next_task is None:
+                break
+            page = await next_task
+            next_task = None
+    finally:
+        # Don't leave a prefetch running if the consumer stops early
+        if next_task is not None and not next_task.done():
+            next_task.cancel()
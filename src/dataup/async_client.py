@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+    TypeVar,
+)
 
 import httpx
 
-from dataup._base import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, BaseClient
-from dataup.exceptions import (
-    AuthenticationError,
-    ConflictError,
-    DataUpAPIError,
-    NotFoundError,
-    PermissionDeniedError,
-    RateLimitError,
-    ValidationError,
+from dataup._base import (
+    DEFAULT_BASE_URL,
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    BaseClient,
+    _enum_value,
+    _gzip_batch_chunks,
+    _inference_request_json,
+    _iter_frames_json,
+    _json_loads,
 )
+from dataup._pagination import paginate_async
+from dataup.exceptions import _STATUS_EXCEPTIONS, DataUpAPIError
 from dataup.models.agents import Agent, AgentCreate, AgentRead, AgentUpdate, AgentUsageMonthly
 from dataup.models.evaluations import (
     BatchIngestRequest,
@@ -25,6 +40,7 @@ from dataup.models.evaluations import (
     EvaluationFrameRead,
     EvaluationRead,
     FinalizeResponse,
+    FrameData,
     JobMetricsResponse,
 )
 from dataup.models.common import CursorPage
@@ -33,10 +49,42 @@ from dataup.models.inference import InferenceRequest, InferenceResponse
 if TYPE_CHECKING:
     from dataup.models.enums import AgentProvider, AgentType
 
+T = TypeVar("T")
+A = TypeVar("A")
+
+# Parametrize the page models once at import time rather than on every call
+_AgentPage = CursorPage[AgentRead]
+_EvaluationPage = CursorPage[EvaluationRead]
+_EvaluationFramePage = CursorPage[EvaluationFrameRead]
+
+
+async def _gather_bounded(
+    func: Callable[[A], Awaitable[T]], args: Sequence[A], concurrency: int
+) -> list[T]:
+    """Run ``func`` over ``args`` concurrently, at most ``concurrency`` at a time.
+
+    Results are returned in the same order as ``args``.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(arg: A) -> T:
+        async with semaphore:
+            return await func(arg)
+
+    return await asyncio.gather(*(run(arg) for arg in args))
+
+
+async def _aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a sync iterator of body chunks to the async stream httpx expects."""
+    for chunk in chunks:
+        yield chunk
+
 
 class AsyncAgentsResource:
     """Async Agents API resource."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AsyncDataUpClient) -> None:
         self._client = client
 
@@ -52,45 +100,59 @@ class AsyncAgentsResource:
         size: int = 10,
     ) -> CursorPage[AgentRead]:
         """List agents with optional filters and pagination."""
-        params: dict[str, Any] = {"size": size}
-        if provider is not None:
-            params["provider"] = provider.value if hasattr(provider, "value") else provider
-        if agent_type is not None:
-            params["agent_type"] = agent_type.value if hasattr(agent_type, "value") else agent_type
-        if is_active is not None:
-            params["is_active"] = is_active
-        if is_public is not None:
-            params["is_public"] = is_public
-        if search is not None:
-            params["search"] = search
-        if cursor is not None:
-            params["cursor"] = cursor
-
+        params: dict[str, Any] = {
+            k: v
+            for k, v in (
+                ("size", size),
+                ("provider", _enum_value(provider)),
+                ("agent_type", _enum_value(agent_type)),
+                ("is_active", is_active),
+                ("is_public", is_public),
+                ("search", search),
+                ("cursor", cursor),
+            )
+            if v is not None
+        }
         response = await self._client._request("GET", "/agents/", params=params)
-        return CursorPage[AgentRead].model_validate(response.json())
+        return _AgentPage.model_validate_json(response.content)
 
     async def get(self, agent_id: str) -> AgentRead:
         """Get a specific agent by ID."""
-        response = await self._client._request("GET", f"/agents/{agent_id}")
-        return AgentRead.model_validate(response.json())
+        return await self._client._get_coalesced(
+            f"/agents/{agent_id}", AgentRead.model_validate_json
+        )
+
+    async def get_many(self, agent_ids: Sequence[str], *, concurrency: int = 20) -> list[AgentRead]:
+        """Get several agents concurrently.
+
+        With HTTP/2 the requests are multiplexed over a single connection.
+
+        Args:
+            agent_ids: IDs of the agents to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Agents in the same order as ``agent_ids``.
+        """
+        return await _gather_bounded(self.get, agent_ids, concurrency)
 
     async def create(self, agent: AgentCreate) -> AgentRead:
         """Create a new agent."""
         response = await self._client._request(
             "POST",
             "/agents/",
-            json=agent.model_dump(mode="json", exclude_unset=True),
+            content=agent.model_dump_json(exclude_unset=True).encode(),
         )
-        return AgentRead.model_validate(response.json())
+        return AgentRead.model_validate_json(response.content)
 
     async def update(self, agent_id: str, agent: AgentUpdate) -> Agent:
         """Update an existing agent."""
         response = await self._client._request(
             "PATCH",
             f"/agents/{agent_id}",
-            json=agent.model_dump(mode="json", exclude_unset=True),
+            content=agent.model_dump_json(exclude_unset=True).encode(),
         )
-        return Agent.model_validate(response.json())
+        return Agent.model_validate_json(response.content)
 
     async def delete(self, agent_id: str) -> None:
         """Delete an agent."""
@@ -101,29 +163,50 @@ class AsyncAgentsResource:
         response = await self._client._request(
             "POST",
             f"/agents/{agent_id}/infer",
-            json=request.model_dump(mode="json", exclude_unset=True),
+            content=_inference_request_json(request),
         )
-        return InferenceResponse.model_validate(response.json())
+        return InferenceResponse.model_validate_json(response.content)
+
+    async def infer_many(
+        self, requests: Sequence[tuple[str, InferenceRequest]], *, concurrency: int = 10
+    ) -> list[InferenceResponse]:
+        """Run several inference requests concurrently.
+
+        Args:
+            requests: ``(agent_id, request)`` pairs to run.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Inference responses in the same order as ``requests``.
+        """
+
+        async def infer(pair: tuple[str, InferenceRequest]) -> InferenceResponse:
+            return await self.infer(*pair)
+
+        return await _gather_bounded(infer, requests, concurrency)
 
     async def activate(self, agent_id: str) -> dict[str, str]:
         """Activate an agent."""
         response = await self._client._request("POST", f"/agents/{agent_id}/activate")
-        return response.json()
+        return _json_loads(response.content)
 
     async def deactivate(self, agent_id: str) -> dict[str, str]:
         """Deactivate an agent."""
         response = await self._client._request("POST", f"/agents/{agent_id}/deactivate")
-        return response.json()
+        return _json_loads(response.content)
 
     async def get_monthly_usage(self, agent_id: str) -> AgentUsageMonthly:
         """Get monthly usage statistics for an agent."""
-        response = await self._client._request("GET", f"/agents/{agent_id}/monthly-usage")
-        return AgentUsageMonthly.model_validate(response.json())
+        return await self._client._get_coalesced(
+            f"/agents/{agent_id}/monthly-usage", AgentUsageMonthly.model_validate_json
+        )
 
 
 class AsyncEvaluationsResource:
     """Async Evaluations API resource."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AsyncDataUpClient) -> None:
         self._client = client
 
@@ -131,16 +214,31 @@ class AsyncEvaluationsResource:
         self, *, cursor: str | None = None, size: int = 10
     ) -> CursorPage[EvaluationRead]:
         """List evaluations with pagination."""
-        params: dict[str, Any] = {"size": size}
-        if cursor is not None:
-            params["cursor"] = cursor
+        params: dict[str, Any] = {
+            k: v for k, v in (("size", size), ("cursor", cursor)) if v is not None
+        }
         response = await self._client._request("GET", "/evaluations/", params=params)
-        return CursorPage[EvaluationRead].model_validate(response.json())
+        return _EvaluationPage.model_validate_json(response.content)
 
     async def get(self, evaluation_id: str) -> EvaluationRead:
         """Get a specific evaluation by ID."""
-        response = await self._client._request("GET", f"/evaluations/{evaluation_id}")
-        return EvaluationRead.model_validate(response.json())
+        return await self._client._get_coalesced(
+            f"/evaluations/{evaluation_id}", EvaluationRead.model_validate_json
+        )
+
+    async def get_many(
+        self, evaluation_ids: Sequence[str], *, concurrency: int = 20
+    ) -> list[EvaluationRead]:
+        """Get several evaluations concurrently.
+
+        Args:
+            evaluation_ids: IDs of the evaluations to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Evaluations in the same order as ``evaluation_ids``.
+        """
+        return await _gather_bounded(self.get, evaluation_ids, concurrency)
 
     async def create(self, evaluation: EvaluationCreate) -> EvaluationCreateResponse:
         """Create a new evaluation.
@@ -154,9 +252,9 @@ class AsyncEvaluationsResource:
         response = await self._client._request(
             "POST",
             "/evaluations/",
-            json=evaluation.model_dump(mode="json", exclude_unset=True),
+            content=evaluation.model_dump_json(exclude_unset=True).encode(),
         )
-        return EvaluationCreateResponse.model_validate(response.json())
+        return EvaluationCreateResponse.model_validate_json(response.content)
 
     async def delete(self, evaluation_id: str) -> None:
         """Delete an evaluation."""
@@ -167,6 +265,11 @@ class AsyncEvaluationsResource:
     ) -> BatchIngestResponse:
         """Ingest a batch of frames into an evaluation.
 
+        The request body is serialized and streamed frame by frame, so large
+        batches are not buffered in memory as a single JSON document. With
+        ``gzip_batches`` enabled on the client, bodies of at least
+        ``GZIP_MIN_SIZE`` bytes are gzip-compressed as they are sent.
+
         Args:
             evaluation_id: ID of the evaluation.
             batch: BatchIngestRequest with frame data.
@@ -174,12 +277,35 @@ class AsyncEvaluationsResource:
         Returns:
             BatchIngestResponse with processing status.
         """
+        return await self.ingest_batch_iter(evaluation_id, batch.frames)
+
+    async def ingest_batch_iter(
+        self, evaluation_id: str, frames: Iterable[FrameData]
+    ) -> BatchIngestResponse:
+        """Ingest frames into an evaluation as a single streamed batch.
+
+        Unlike :meth:`ingest_batch`, no ``BatchIngestRequest`` is built: frames
+        are serialized one at a time as the request body is sent, so a
+        generator of frames keeps memory use flat regardless of batch size.
+
+        Args:
+            evaluation_id: ID of the evaluation.
+            frames: Frames to ingest, consumed lazily.
+
+        Returns:
+            BatchIngestResponse with processing status.
+        """
+        chunks = _iter_frames_json(frames)
+        headers = None
+        if self._client.gzip_batches:
+            chunks, headers = _gzip_batch_chunks(chunks)
         response = await self._client._request(
             "POST",
             f"/evaluations/{evaluation_id}/batches",
-            json=batch.model_dump(mode="json", exclude_unset=True),
+            content=_aiter_chunks(chunks),
+            headers=headers,
         )
-        return BatchIngestResponse.model_validate(response.json())
+        return BatchIngestResponse.model_validate_json(response.content)
 
     async def finalize(self, evaluation_id: str) -> FinalizeResponse:
         """Finalize an evaluation and compute COCO metrics.
@@ -196,7 +322,7 @@ class AsyncEvaluationsResource:
             "POST",
             f"/evaluations/{evaluation_id}/finalize",
         )
-        return FinalizeResponse.model_validate(response.json())
+        return FinalizeResponse.model_validate_json(response.content)
 
     async def get_frames(
         self,
@@ -217,17 +343,39 @@ class AsyncEvaluationsResource:
         Returns:
             CursorPage of EvaluationFrameRead objects.
         """
-        params: dict[str, Any] = {"size": size}
-        if job_id is not None:
-            params["job_id"] = job_id
-        if cursor is not None:
-            params["cursor"] = cursor
+        params: dict[str, Any] = {
+            k: v
+            for k, v in (("size", size), ("job_id", job_id), ("cursor", cursor))
+            if v is not None
+        }
         response = await self._client._request(
             "GET",
             f"/evaluations/{evaluation_id}/frames",
             params=params,
         )
-        return CursorPage[EvaluationFrameRead].model_validate(response.json())
+        return _EvaluationFramePage.model_validate_json(response.content)
+
+    def iter_frames(
+        self,
+        evaluation_id: str,
+        *,
+        job_id: int | None = None,
+        size: int = 100,
+    ) -> AsyncIterator[EvaluationFrameRead]:
+        """Async iterate over all frames of an evaluation, following cursors.
+
+        The next page is prefetched while the current one is consumed; at most
+        two pages of frames are held in memory at a time.
+
+        Args:
+            evaluation_id: ID of the evaluation.
+            job_id: Optional job ID to filter frames.
+            size: Number of frames requested per page.
+
+        Yields:
+            EvaluationFrameRead objects in server order.
+        """
+        return paginate_async(partial(self.get_frames, evaluation_id), job_id=job_id, size=size)
 
     async def get_job_metrics(
         self, evaluation_id: str, *, confidence_threshold: float = 0.5
@@ -247,11 +395,40 @@ class AsyncEvaluationsResource:
             f"/evaluations/{evaluation_id}/job_metrics",
             params=params,
         )
-        return JobMetricsResponse.model_validate(response.json())
+        return JobMetricsResponse.model_validate_json(response.content)
 
 
 class AsyncDataUpClient(BaseClient):
-    """Asynchronous DataUp API client."""
+    """Asynchronous DataUp API client.
+
+    By default the underlying ``httpx.AsyncClient`` negotiates HTTP/2, so
+    concurrent requests to the API are multiplexed over a single connection.
+    Pass ``http2=False`` or custom ``limits`` to tune the connection pool.
+
+    Avoid creating a new client per request. When several clients are needed
+    (e.g. one per API key), share a single connection pool between them by
+    passing the same ``httpx.AsyncHTTPTransport`` as ``transport``. A shared
+    transport is not closed by :meth:`aclose`; its owner must close it. The
+    transport's own HTTP/2 and pool settings take precedence: ``http2`` and
+    ``limits`` are ignored when ``transport`` is given.
+
+    Pass ``gzip_batches=True`` to gzip-compress batch ingest bodies of at
+    least ``GZIP_MIN_SIZE`` bytes when the API deployment accepts
+    ``Content-Encoding: gzip`` requests.
+
+    For network-heavy workloads, install the ``fast`` extra and call
+    :meth:`install_uvloop` (or ``uvloop.install()``) before starting the
+    event loop.
+    """
+
+    __slots__ = (
+        "_client",
+        "_shared_transport",
+        "_closed",
+        "_inflight_gets",
+        "agents",
+        "evaluations",
+    )
 
     agents: AsyncAgentsResource
     evaluations: AsyncEvaluationsResource
@@ -263,15 +440,50 @@ class AsyncDataUpClient(BaseClient):
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = True,
+        limits: httpx.Limits | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        gzip_batches: bool = False,
     ) -> None:
-        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        super().__init__(api_key, base_url=base_url, timeout=timeout, gzip_batches=gzip_batches)
+
+        self._shared_transport = http_client is None and transport is not None
+        # A caller-supplied http_client is the caller's to close
+        self._closed = http_client is not None
+        self._client = http_client or httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self._headers,
+            http2=http2,
+            limits=limits or DEFAULT_LIMITS,
+            transport=transport,
+        )
 
-        self._client = http_client or httpx.AsyncClient(timeout=self.timeout, headers=self._headers)
+        # Concurrent get/get_monthly_usage calls for the same path share one request
+        self._inflight_gets: dict[str, asyncio.Task[Any]] = {}
 
         # Initialize resources
         self.agents = AsyncAgentsResource(self)
         self.evaluations = AsyncEvaluationsResource(self)
 
+    @staticmethod
+    def install_uvloop() -> None:
+        """Install uvloop as the asyncio event loop policy.
+
+        Must be called before the event loop is created (e.g. before ``asyncio.run``).
+
+        Raises:
+            ImportError: If uvloop is not installed.
+        """
+        try:
+            import uvloop
+        except ImportError as e:
+            raise ImportError(
+                "uvloop package is required for install_uvloop(). "
+                "Install it with: pip install dataup[fast]"
+            ) from e
+
+        uvloop.install()
+
     async def _request(
         self,
         method: str,
@@ -279,43 +491,82 @@ class AsyncDataUpClient(BaseClient):
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        content: bytes | AsyncIterable[bytes] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        """Make async HTTP request and handle errors."""
-        url = self._build_url(path)
-        response = await self._client.request(method, url, params=params, json=json)
+        """Make async HTTP request and handle errors.
+
+        Pre-serialized JSON bodies (e.g. from ``model_dump_json``) should be
+        passed as ``content`` to skip re-encoding them in httpx. An async
+        iterable of chunks is sent as a streamed body.
+        """
+        request = self._client.build_request(
+            method,
+            self._url_prefix + path,
+            params=params,
+            json=json,
+            content=content,
+            headers=headers,
+        )
+        response = await self._client.send(request)
         self._handle_response(response)
         return response
 
+    async def _get_coalesced(self, path: str, parse: Callable[[bytes], T]) -> T:
+        """GET and parse a resource, sharing the result with identical calls in flight.
+
+        Callers that ask for the same path while a request for it is running
+        await that request and receive the same parsed model (or error)
+        instead of sending a duplicate. Nothing is cached once it completes.
+        """
+        task = self._inflight_gets.get(path)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_parsed(path, parse))
+            self._inflight_gets[path] = task
+            task.add_done_callback(partial(self._forget_inflight, path))
+        # Shield so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _fetch_parsed(self, path: str, parse: Callable[[bytes], T]) -> T:
+        """GET a resource and parse its body."""
+        response = await self._request("GET", path)
+        return parse(response.content)
+
+    def _forget_inflight(self, path: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished shared GET from the in-flight table."""
+        if self._inflight_gets.get(path) is task:
+            del self._inflight_gets[path]
+        # Retrieve the error so it isn't logged as unhandled when every
+        # waiter was cancelled before the request finished
+        if not task.cancelled():
+            task.exception()
+
     def _handle_response(self, response: httpx.Response) -> None:
         """Handle HTTP response and raise appropriate exceptions."""
         if response.is_success:
             return
 
         status_code = response.status_code
+        message = response.text
+        # Decode regardless of content type: error bodies also arrive as
+        # application/problem+json or with no content type at all
         try:
-            error_data = response.json()
-            message = error_data.get("detail", error_data.get("message", response.text))
+            error_data = _json_loads(response.content)
+            message = error_data.get("detail", error_data.get("message", message))
         except Exception:
-            message = response.text
-
-        if status_code == 400:
-            raise ValidationError(message, status_code=status_code)
-        elif status_code == 401:
-            raise AuthenticationError(message, status_code=status_code)
-        elif status_code == 403:
-            raise PermissionDeniedError(message, status_code=status_code)
-        elif status_code == 404:
-            raise NotFoundError(message, status_code=status_code)
-        elif status_code == 409:
-            raise ConflictError(message, status_code=status_code)
-        elif status_code == 429:
-            raise RateLimitError(message, status_code=status_code)
-        else:
-            raise DataUpAPIError(message, status_code=status_code)
+            pass
+
+        exc_cls = _STATUS_EXCEPTIONS.get(status_code, DataUpAPIError)
+        raise exc_cls(message, status_code=status_code)
 
     async def aclose(self) -> None:
-        """Close the async HTTP client."""
-        await self._client.aclose()
+        """Close the async HTTP client.
+
+        A transport passed in via ``transport`` is left open for its other users.
+        """
+        if not self._shared_transport:
+            await self._client.aclose()
+        self._closed = True
 
     async def __aenter__(self) -> AsyncDataUpClient:
         return self
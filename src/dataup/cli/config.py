@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import configparser
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # Config file location
@@ -26,6 +27,36 @@ def save_config(config: configparser.ConfigParser) -> None:
         config.write(f)
     # Set restrictive permissions (owner read/write only)
     CONFIG_FILE.chmod(0o600)
+    # A rewrite within the filesystem's timestamp granularity keeps the same
+    # mtime, so drop cached settings explicitly
+    _read_settings.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _read_settings(mtime_ns: int) -> dict[str, dict[str, str]]:
+    """Parse the config file into {section: {key: value}}.
+
+    Cached on the file's modification time, so the file is read at most once
+    per CLI invocation unless it changes. This is a minimal single-pass INI
+    reader for the flat format written by ``save_config``.
+    """
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    for raw_line in CONFIG_FILE.read_text().splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            current = sections.setdefault(line[1:-1].strip(), {})
+            continue
+        if current is None:
+            continue
+        key, sep, value = line.partition("=")
+        if not sep:
+            key, sep, value = line.partition(":")
+        if sep:
+            current[key.strip().lower()] = value.strip()
+    return sections
 
 
 def get_setting(key: str, env_var: str, section: str = "default") -> str | None:
@@ -39,8 +70,8 @@ def get_setting(key: str, env_var: str, section: str = "default") -> str | None:
         return value
 
     # Fall back to config file
-    config = get_config()
-    if config.has_option(section, key):
-        return config.get(section, key)
-
-    return None
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_settings(mtime_ns).get(section, {}).get(key)
@@ -3,16 +3,11 @@
 from __future__ import annotations
 
 import sys
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Coroutine
 
 import click
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
-from rich.table import Table
 
 from dataup.cli.utils import (
     console,
@@ -24,6 +19,16 @@ from dataup.cli.utils import (
     get_provider,
 )
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Maximum number of CVAT frame requests kept in flight by from-checkpoint
+MAX_INFLIGHT_FRAMES = 16
+# Maximum number of batch uploads kept in flight by from-checkpoint
+MAX_INFLIGHT_SUBMITS = 4
+# Seconds from-checkpoint waits to fill a batch before running it partially filled
+BATCH_FLUSH_TIMEOUT = 0.5
+
 
 @click.group()
 def evaluation():
@@ -114,6 +119,14 @@ def evaluation_run(
 
         dataup evaluation run --provider ultralytics --task 121 --weights yolov8n.pt
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
     from dataup.evaluation import EvaluationRunner
 
     # Get clients
@@ -150,8 +163,16 @@ def evaluation_run(
     ) as progress:
         task_progress = progress.add_task("Processing frames...", total=None)
 
+        last_update = 0.0
+
         def update_progress(current: int, total: int):
-            progress.update(task_progress, completed=current, total=total)
+            # The runner reports every frame; only touch the progress bar every
+            # few frames or when enough time has passed
+            nonlocal last_update
+            now = time.monotonic()
+            if current % 10 == 0 or current >= total or now - last_update > 0.1:
+                last_update = now
+                progress.update(task_progress, completed=current, total=total)
 
         try:
             result = runner.run_and_submit(
@@ -167,6 +188,8 @@ def evaluation_run(
         except Exception as e:
             console.print(f"\n[red]Error running evaluation:[/red] {e}")
             sys.exit(1)
+        finally:
+            inference_provider.close()
 
     display_evaluation_results(result)
 
@@ -220,6 +243,8 @@ def evaluation_list(limit: int):
 
         dataup evaluation list --limit 20
     """
+    from rich.table import Table
+
     dataup_client = get_dataup_client()
 
     try:
@@ -360,11 +385,11 @@ def evaluation_from_checkpoint(
     """Run evaluation using a model checkpoint, iterating over CVAT jobs.
 
     This command uses async I/O for efficient image fetching and batch
-    submission while keeping inference synchronous. It:
+    submission, overlapping both with inference. It:
     1. Creates an evaluation and gets its ID
     2. Loads the model from the checkpoint
     3. Iterates over each job in the CVAT task
-    4. For each frame: fetches the image (async), runs inference (sync), gets ground truth
+    4. For each frame: fetches the image (async), runs inference (worker thread), gets ground truth
     5. Submits batches to DataUp via batch_ingest (async)
     6. Finalizes the evaluation
 
@@ -373,6 +398,9 @@ def evaluation_from_checkpoint(
         dataup evaluation from-checkpoint --provider ultralytics --task 121 --checkpoint best.pt
     """
     import asyncio
+    import contextlib
+
+    from dataup import AsyncDataUpClient
 
     # Get provider and load model first (sync)
     inference_provider = get_provider(provider)
@@ -389,6 +417,10 @@ def evaluation_from_checkpoint(
 
     console.print(f"Model loaded. Classes: {len(inference_provider.class_names)}")
 
+    # Use uvloop for the network-heavy pipeline when the fast extra is installed
+    with contextlib.suppress(ImportError):
+        AsyncDataUpClient.install_uvloop()
+
     # Run the async evaluation
     try:
         asyncio.run(
@@ -407,6 +439,58 @@ def evaluation_from_checkpoint(
     except Exception as e:
         console.print(f"\n[red]Error:[/red] {e}")
         sys.exit(1)
+    finally:
+        inference_provider.close()
+
+
+@lru_cache(maxsize=1)
+def _turbojpeg() -> Any:
+    """Return a shared TurboJPEG decoder, or None if it is unavailable.
+
+    Needs the optional ``PyTurboJPEG`` package and the libjpeg-turbo library.
+    """
+    try:
+        from turbojpeg import TurboJPEG
+
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None
+
+
+def _decode_image(data: bytes) -> Image.Image:
+    """Decode encoded image bytes into a fully loaded PIL Image."""
+    import io
+
+    from PIL import Image
+
+    # libjpeg-turbo decodes JPEG frames several times faster than Pillow
+    if data[:2] == b"\xff\xd8" and (jpeg := _turbojpeg()) is not None:
+        from turbojpeg import TJPF_RGB
+
+        return Image.fromarray(jpeg.decode(data, pixel_format=TJPF_RGB))
+
+    image = Image.open(io.BytesIO(data))
+    # Image.open is lazy; force the decode to happen on the calling thread
+    image.load()
+    return image
+
+
+async def _run_stages(*stages: Coroutine[Any, Any, None]) -> None:
+    """Run pipeline stages concurrently, cancelling the rest if one fails.
+
+    Without the cancellation a failed stage would leave its neighbours blocked
+    forever on a full or empty queue.
+    """
+    import asyncio
+
+    tasks = [asyncio.ensure_future(stage) for stage in stages]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 async def _run_evaluation_from_checkpoint(
@@ -421,11 +505,21 @@ async def _run_evaluation_from_checkpoint(
     batch_size: int,
 ):
     """Async implementation of evaluation from checkpoint."""
-    import io
-
-    from PIL import Image
+    import asyncio
+    import os
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
 
     from dataup_models.labels import Label
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
     from dataup.models.evaluations import (
         BatchIngestRequest,
         EvaluationCreate,
@@ -437,20 +531,34 @@ async def _run_evaluation_from_checkpoint(
     dataup_client = get_async_dataup_client()
     cvat_client = get_async_cvat_client()
 
+    # Inference and image decoding are blocking, so both run on one shared
+    # worker pool to keep the event loop free for fetches and uploads. Pillow
+    # releases the GIL while decoding, so decodes overlap with each other and
+    # with inference. Only one predict call is ever in flight.
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(
+        max_workers=(os.cpu_count() or 1) + 1, thread_name_prefix="dataup-eval"
+    )
+
     try:
         # Fetch task details to get jobs
         console.print(f"\nFetching CVAT task [cyan]{task_id}[/cyan]...")
         cvat_task = await cvat_client.tasks.get(task_id)
         jobs_to_process = cvat_task.jobs
 
-        # Calculate total frames and get job frame ranges
-        total_frames = 0
-        job_frame_ranges: dict[int, tuple[int, int]] = {}
-        for job_summary in jobs_to_process:
-            job = await cvat_client.jobs.get(job_summary.id)
-            frame_count = job.stop_frame - job.start_frame + 1
-            total_frames += frame_count
-            job_frame_ranges[job_summary.id] = (job.start_frame, job.stop_frame)
+        # Fetch all jobs and the task's labels (shared by every job) concurrently,
+        # then derive total frames and frame ranges
+        cvat_labels, jobs = await asyncio.gather(
+            cvat_client.tasks.get_task_labels(task_id),
+            asyncio.gather(
+                *(cvat_client.jobs.get(job_summary.id) for job_summary in jobs_to_process)
+            ),
+        )
+        job_frame_ranges: dict[int, tuple[int, int]] = {
+            job_summary.id: (job.start_frame, job.stop_frame)
+            for job_summary, job in zip(jobs_to_process, jobs, strict=True)
+        }
+        total_frames = sum(stop - start + 1 for start, stop in job_frame_ranges.values())
 
         console.print(f"Found {len(jobs_to_process)} jobs with {total_frames} total frames")
 
@@ -469,9 +577,14 @@ async def _run_evaluation_from_checkpoint(
         evaluation_id = create_response.evaluation_id
         console.print(f"Created evaluation: [cyan]{evaluation_id}[/cyan]")
 
-        # Process frames and submit in batches
+        # Process frames as a three-stage pipeline: fetch -> inference -> submit.
+        # Bounded queues let image fetches and batch uploads overlap with
+        # inference instead of stalling it.
+        frame_queue: asyncio.Queue[tuple[int, int, Image.Image, list[Label]] | None] = (
+            asyncio.Queue(maxsize=2 * batch_size)
+        )
+        submit_queue: asyncio.Queue[list[FrameData] | None] = asyncio.Queue(maxsize=2)
         processed_frames = 0
-        current_batch: list[FrameData] = []
 
         with Progress(
             SpinnerColumn(),
@@ -482,64 +595,155 @@ async def _run_evaluation_from_checkpoint(
         ) as progress:
             task_progress = progress.add_task("Processing frames...", total=total_frames)
 
-            for job_summary in jobs_to_process:
-                job_id = job_summary.id
-                start_frame, stop_frame = job_frame_ranges[job_id]
-
-                # Get frame metadata and annotations for this job (async)
-                meta = await cvat_client.jobs.get_data_meta(job_id)
-                annotations_list = await cvat_client.jobs.get_annotations(job_id)
+            async def fetch_frames() -> None:
+                # Keep a sliding window of frame requests in flight. Requests
+                # are reaped in submission order, so frames reach inference
+                # in order.
+                pending: deque[tuple[int, int, list[Label], asyncio.Future[Any]]] = deque()
 
-                # Build frame_id -> ground truth lookup
-                frame_annotations: dict[int, list[Label]] = {}
-                for frame_labels in annotations_list:
-                    frame_annotations[frame_labels.frame_id] = frame_labels.labels
-
-                for frame_id in range(start_frame, stop_frame + 1):
-                    # Skip deleted frames
-                    if frame_id in meta.deleted_frames:
-                        continue
-
-                    # Fetch frame image from CVAT (async)
+                async def fetch_and_decode(job_id: int, frame_id: int) -> Image.Image:
                     frame_image = await cvat_client.jobs.get_frame(job_id, frame_id)
+                    return await loop.run_in_executor(executor, _decode_image, frame_image.data)
+
+                async def emit_oldest() -> None:
+                    job_id, frame_id, ground_truth, fetch = pending.popleft()
+                    pil_image = await fetch
+                    await frame_queue.put((job_id, frame_id, pil_image, ground_truth))
+
+                try:
+                    for job_summary in jobs_to_process:
+                        job_id = job_summary.id
+                        start_frame, stop_frame = job_frame_ranges[job_id]
+
+                        # Get frame metadata and annotations for this job (async)
+                        meta, annotations_list = await asyncio.gather(
+                            cvat_client.jobs.get_data_meta(job_id),
+                            cvat_client.jobs.get_annotations(job_id, cvat_labels=cvat_labels),
+                        )
+
+                        # Frame ids are a dense range, so index ground truth by
+                        # offset instead of hashing into a dict
+                        gt_by_frame: list[list[Label] | None] = [None] * (
+                            stop_frame - start_frame + 1
+                        )
+                        for frame_labels in annotations_list:
+                            offset = frame_labels.frame_id - start_frame
+                            if 0 <= offset < len(gt_by_frame):
+                                gt_by_frame[offset] = frame_labels.labels
+                        deleted_frames = frozenset(meta.deleted_frames)
+
+                        for frame_id in range(start_frame, stop_frame + 1):
+                            # Skip deleted frames
+                            if frame_id in deleted_frames:
+                                continue
+
+                            # Fetch frame image from CVAT (async) and decode it
+                            fetch = asyncio.ensure_future(fetch_and_decode(job_id, frame_id))
+                            ground_truth = gt_by_frame[frame_id - start_frame] or []
+                            pending.append((job_id, frame_id, ground_truth, fetch))
+                            if len(pending) >= MAX_INFLIGHT_FRAMES:
+                                await emit_oldest()
+
+                    while pending:
+                        await emit_oldest()
+                    await frame_queue.put(None)
+                finally:
+                    for *_, fetch in pending:
+                        fetch.cancel()
+
+            async def run_inference() -> None:
+                nonlocal processed_frames
+                # A single get() is kept outstanding across batches. Timing it
+                # out with wait_for would cancel it, and on Python < 3.12 a
+                # cancelled get() can drop an item it has already dequeued.
+                next_item: asyncio.Future[Any] | None = None
+                done = False
+                try:
+                    while not done:
+                        if next_item is None:
+                            next_item = asyncio.ensure_future(frame_queue.get())
+                        item = await next_item
+                        next_item = None
+                        if item is None:
+                            break
+
+                        # Collect up to batch_size frames for a single model call,
+                        # but don't hold a partial batch back waiting on stragglers
+                        pending_frames = [item]
+                        deadline = loop.time() + BATCH_FLUSH_TIMEOUT
+                        while len(pending_frames) < batch_size:
+                            timeout = deadline - loop.time()
+                            if timeout <= 0:
+                                break
+                            next_item = asyncio.ensure_future(frame_queue.get())
+                            await asyncio.wait({next_item}, timeout=timeout)
+                            if not next_item.done():
+                                break
+                            item = next_item.result()
+                            next_item = None
+                            if item is None:
+                                done = True
+                                break
+                            pending_frames.append(item)
+
+                        # Run batched inference off the event loop thread
+                        images = [pil_image for _, _, pil_image, _ in pending_frames]
+                        batch_predictions = await loop.run_in_executor(
+                            executor,
+                            partial(inference_provider.predict_batch, images, conf=conf, iou=iou),
+                        )
 
-                    # Convert to PIL Image for inference
-                    pil_image = Image.open(io.BytesIO(frame_image.data))
-
-                    # Run inference on the image (sync - blocks event loop but that's OK)
-                    predictions = inference_provider.predict(pil_image, conf=conf, iou=iou)
-
-                    # Get ground truth from CVAT annotations
-                    ground_truth = frame_annotations.get(frame_id, [])
-
-                    # Create frame data
-                    frame_data = FrameData(
-                        job_id=job_id,
-                        frame_id=frame_id,
-                        ground_truth=ground_truth,
-                        predictions=predictions,
-                        image_width=pil_image.width,
-                        image_height=pil_image.height,
-                    )
-                    current_batch.append(frame_data)
-
-                    processed_frames += 1
-                    progress.update(task_progress, completed=processed_frames)
-
-                    # Submit batch when full (async)
-                    if len(current_batch) >= batch_size:
-                        await dataup_client.evaluations.ingest_batch(
-                            evaluation_id,
-                            BatchIngestRequest(frames=current_batch),
+                        # Labels were already validated by the provider and the CVAT
+                        # client, so skip re-validating them for every frame
+                        frames = [
+                            FrameData.model_construct(
+                                job_id=job_id,
+                                frame_id=frame_id,
+                                ground_truth=ground_truth,
+                                predictions=predictions,
+                                image_width=pil_image.width,
+                                image_height=pil_image.height,
+                            )
+                            for (job_id, frame_id, pil_image, ground_truth), predictions in zip(
+                                pending_frames, batch_predictions, strict=True
+                            )
+                        ]
+
+                        processed_frames += len(frames)
+                        progress.update(task_progress, completed=processed_frames)
+
+                        # Hand off the batch for upload
+                        await submit_queue.put(frames)
+                finally:
+                    if next_item is not None:
+                        next_item.cancel()
+
+                await submit_queue.put(None)
+
+            async def submit_batches() -> None:
+                # Keep several uploads in flight; only wait for the oldest once
+                # the limit is reached
+                inflight_submits: deque[asyncio.Future[Any]] = deque()
+                try:
+                    while (frames := await submit_queue.get()) is not None:
+                        if len(inflight_submits) >= MAX_INFLIGHT_SUBMITS:
+                            await inflight_submits.popleft()
+                        inflight_submits.append(
+                            asyncio.ensure_future(
+                                dataup_client.evaluations.ingest_batch(
+                                    evaluation_id,
+                                    BatchIngestRequest.model_construct(frames=frames),
+                                )
+                            )
                         )
-                        current_batch = []
+                    # Every batch must be stored before the evaluation is finalized
+                    while inflight_submits:
+                        await inflight_submits.popleft()
+                finally:
+                    for submit in inflight_submits:
+                        submit.cancel()
 
-            # Submit any remaining frames (async)
-            if current_batch:
-                await dataup_client.evaluations.ingest_batch(
-                    evaluation_id,
-                    BatchIngestRequest(frames=current_batch),
-                )
+            await _run_stages(fetch_frames(), run_inference(), submit_batches())
 
         # Finalize the evaluation (async)
         console.print("\nFinalizing evaluation...")
@@ -550,8 +754,10 @@ async def _run_evaluation_from_checkpoint(
         display_evaluation_results(result)
 
     finally:
-        await dataup_client.aclose()
-        await cvat_client.aclose()
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Close both clients concurrently; a failure closing one must not
+        # prevent the other from closing
+        await asyncio.gather(dataup_client.aclose(), cvat_client.aclose(), return_exceptions=True)
 
 
 eval_alias.add_command(evaluation_from_checkpoint, name="from-checkpoint")
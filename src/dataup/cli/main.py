@@ -2,28 +2,50 @@
 
 from __future__ import annotations
 
+import importlib
 import os
 
 import click
-from rich.table import Table
 
 from dataup.cli.config import CONFIG_FILE, get_config, save_config
-from dataup.cli.evaluation import eval_alias, evaluation
 from dataup.cli.utils import console
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports some subcommands only when they are used.
+
+    ``lazy_subcommands`` maps a command name to ``"module:attribute"``.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+
+# Evaluation commands pull in progress rendering and the evaluation stack,
+# so they are only imported when invoked
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "evaluation": "dataup.cli.evaluation:evaluation",
+        "eval": "dataup.cli.evaluation:eval_alias",
+    },
+)
 @click.version_option(package_name="dataup")
 def cli():
     """DataUp CLI for model evaluation and more."""
     pass
 
 
-# Register evaluation commands
-cli.add_command(evaluation)
-cli.add_command(eval_alias)
-
-
 @cli.command()
 def configure():
     """Configure DataUp CLI credentials.
@@ -104,6 +126,8 @@ def show_config():
 
         dataup show-config
     """
+    from rich.table import Table
+
     config = get_config()
 
     table = Table(title="DataUp Configuration")
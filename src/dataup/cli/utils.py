@@ -6,7 +6,6 @@ import sys
 from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.table import Table
 
 from dataup.cli.config import get_setting
 
@@ -30,6 +29,17 @@ def get_dataup_client():
     return DataUpClient(api_key=api_key)
 
 
+def _async_http_limits():
+    """Connection pool limits for the CLI's async clients.
+
+    The from-checkpoint pipeline keeps many requests in flight at once, so
+    allow more kept-alive connections than httpx's default.
+    """
+    import httpx
+
+    return httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
 def get_async_dataup_client():
     """Get async DataUp client from config or environment variables."""
     from dataup import AsyncDataUpClient
@@ -41,7 +51,7 @@ def get_async_dataup_client():
         console.print("Or set: export DATAUP_API_KEY='your_key_id.your_key_secret'")
         sys.exit(1)
 
-    return AsyncDataUpClient(api_key=api_key)
+    return AsyncDataUpClient(api_key=api_key, http2=True, limits=_async_http_limits())
 
 
 def get_cvat_client():
@@ -71,7 +81,10 @@ def get_async_cvat_client():
         sys.exit(1)
 
     base_url = get_setting("cvat_base_url", "CVAT_BASE_URL") or "https://app.cvat.ai"
-    return AsyncCVATClient(api_token=api_token, base_url=base_url)
+    # HTTP/2 multiplexes concurrent frame requests over one connection
+    return AsyncCVATClient(
+        api_token=api_token, base_url=base_url, http2=True, limits=_async_http_limits()
+    )
 
 
 def get_provider(provider_name: str):
@@ -91,6 +104,8 @@ def get_provider(provider_name: str):
 
 def display_evaluation_results(evaluation: EvaluationRead) -> None:
     """Display evaluation results in a formatted table."""
+    from rich.table import Table
+
     console.print()
     console.print("[bold green]Evaluation Complete[/bold green]")
     console.print(f"Evaluation ID: [cyan]{evaluation.id}[/cyan]")
@@ -131,16 +146,21 @@ def display_evaluation_results(evaluation: EvaluationRead) -> None:
         class_table.add_column("GT Count", justify="right")
         class_table.add_column("Det Count", justify="right")
 
-        for cm in evaluation.per_class_summary_metrics:
-            class_table.add_row(
+        # Format every row up front, then add them in one pass
+        rows = [
+            (
                 cm.class_name,
-                f"{cm.ap:.4f}",
-                f"{cm.ap_50:.4f}",
-                f"{cm.ap_75:.4f}",
-                f"{cm.ar_100:.4f}",
+                format(cm.ap, ".4f"),
+                format(cm.ap_50, ".4f"),
+                format(cm.ap_75, ".4f"),
+                format(cm.ar_100, ".4f"),
                 str(cm.ground_truth_count),
                 str(cm.detection_count),
             )
+            for cm in evaluation.per_class_summary_metrics
+        ]
+        for row in rows:
+            class_table.add_row(*row)
 
         console.print(class_table)
         console.print()
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 import httpx
 
-from dataup._base import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, BaseClient
-from dataup.exceptions import (
-    AuthenticationError,
-    ConflictError,
-    DataUpAPIError,
-    NotFoundError,
-    PermissionDeniedError,
-    RateLimitError,
-    ValidationError,
+from dataup._base import (
+    DEFAULT_BASE_URL,
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    BaseClient,
+    _enum_value,
+    _gzip_batch_chunks,
+    _inference_request_json,
+    _iter_frames_json,
+    _json_loads,
 )
+from dataup._pagination import paginate
+from dataup.exceptions import _STATUS_EXCEPTIONS, DataUpAPIError
 from dataup.models.agents import Agent, AgentCreate, AgentRead, AgentUpdate, AgentUsageMonthly
 from dataup.models.evaluations import (
     BatchIngestRequest,
@@ -25,6 +30,7 @@ from dataup.models.evaluations import (
     EvaluationFrameRead,
     EvaluationRead,
     FinalizeResponse,
+    FrameData,
     JobMetricsResponse,
 )
 from dataup.models.common import CursorPage
@@ -33,10 +39,17 @@ from dataup.models.inference import InferenceRequest, InferenceResponse
 if TYPE_CHECKING:
     from dataup.models.enums import AgentProvider, AgentType
 
+# Parametrize the page models once at import time rather than on every call
+_AgentPage = CursorPage[AgentRead]
+_EvaluationPage = CursorPage[EvaluationRead]
+_EvaluationFramePage = CursorPage[EvaluationFrameRead]
+
 
 class AgentsResource:
     """Agents API resource."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: DataUpClient) -> None:
         self._client = client
 
@@ -52,45 +65,44 @@ class AgentsResource:
         size: int = 10,
     ) -> CursorPage[AgentRead]:
         """List agents with optional filters and pagination."""
-        params: dict[str, Any] = {"size": size}
-        if provider is not None:
-            params["provider"] = provider.value if hasattr(provider, "value") else provider
-        if agent_type is not None:
-            params["agent_type"] = agent_type.value if hasattr(agent_type, "value") else agent_type
-        if is_active is not None:
-            params["is_active"] = is_active
-        if is_public is not None:
-            params["is_public"] = is_public
-        if search is not None:
-            params["search"] = search
-        if cursor is not None:
-            params["cursor"] = cursor
-
+        params: dict[str, Any] = {
+            k: v
+            for k, v in (
+                ("size", size),
+                ("provider", _enum_value(provider)),
+                ("agent_type", _enum_value(agent_type)),
+                ("is_active", is_active),
+                ("is_public", is_public),
+                ("search", search),
+                ("cursor", cursor),
+            )
+            if v is not None
+        }
         response = self._client._request("GET", "/agents/", params=params)
-        return CursorPage[AgentRead].model_validate(response.json())
+        return _AgentPage.model_validate_json(response.content)
 
     def get(self, agent_id: str) -> AgentRead:
         """Get a specific agent by ID."""
         response = self._client._request("GET", f"/agents/{agent_id}")
-        return AgentRead.model_validate(response.json())
+        return AgentRead.model_validate_json(response.content)
 
     def create(self, agent: AgentCreate) -> AgentRead:
         """Create a new agent."""
         response = self._client._request(
             "POST",
             "/agents/",
-            json=agent.model_dump(mode="json", exclude_unset=True),
+            content=agent.model_dump_json(exclude_unset=True).encode(),
         )
-        return AgentRead.model_validate(response.json())
+        return AgentRead.model_validate_json(response.content)
 
     def update(self, agent_id: str, agent: AgentUpdate) -> Agent:
         """Update an existing agent."""
         response = self._client._request(
             "PATCH",
             f"/agents/{agent_id}",
-            json=agent.model_dump(mode="json", exclude_unset=True),
+            content=agent.model_dump_json(exclude_unset=True).encode(),
         )
-        return Agent.model_validate(response.json())
+        return Agent.model_validate_json(response.content)
 
     def delete(self, agent_id: str) -> None:
         """Delete an agent."""
@@ -101,29 +113,91 @@ class AgentsResource:
         response = self._client._request(
             "POST",
             f"/agents/{agent_id}/infer",
-            json=request.model_dump(mode="json", exclude_unset=True),
+            content=_inference_request_json(request),
         )
-        return InferenceResponse.model_validate(response.json())
+        return InferenceResponse.model_validate_json(response.content)
 
     def activate(self, agent_id: str) -> dict[str, str]:
         """Activate an agent."""
         response = self._client._request("POST", f"/agents/{agent_id}/activate")
-        return response.json()
+        return _json_loads(response.content)
 
     def deactivate(self, agent_id: str) -> dict[str, str]:
         """Deactivate an agent."""
         response = self._client._request("POST", f"/agents/{agent_id}/deactivate")
-        return response.json()
+        return _json_loads(response.content)
 
     def get_monthly_usage(self, agent_id: str) -> AgentUsageMonthly:
         """Get monthly usage statistics for an agent."""
         response = self._client._request("GET", f"/agents/{agent_id}/monthly-usage")
-        return AgentUsageMonthly.model_validate(response.json())
+        return AgentUsageMonthly.model_validate_json(response.content)
+
+
+class BatchAccumulator:
+    """Collects frames and ingests them into an evaluation in batches.
+
+    Pending frames are sent once ``max_frames`` have accumulated, or when a
+    frame is added more than ``max_delay`` seconds after the oldest pending
+    one. Remaining frames are sent when the context manager exits cleanly.
+    Create one with :meth:`EvaluationsResource.batched_ingest`.
+    """
+
+    __slots__ = ("_evaluations", "_evaluation_id", "_pending", "_oldest", "max_frames", "max_delay")
+
+    def __init__(
+        self,
+        evaluations: EvaluationsResource,
+        evaluation_id: str,
+        *,
+        max_frames: int = 256,
+        max_delay: float = 0.5,
+    ) -> None:
+        self._evaluations = evaluations
+        self._evaluation_id = evaluation_id
+        self._pending: list[FrameData] = []
+        self._oldest = 0.0
+        self.max_frames = max_frames
+        self.max_delay = max_delay
+
+    def add_frame(self, frame: FrameData) -> BatchIngestResponse | None:
+        """Queue a frame, sending the pending batch if a flush is due.
+
+        Returns:
+            The BatchIngestResponse if a batch was sent, otherwise None.
+        """
+        now = time.monotonic()
+        if not self._pending:
+            self._oldest = now
+        self._pending.append(frame)
+        if len(self._pending) >= self.max_frames or now - self._oldest >= self.max_delay:
+            return self.flush()
+        return None
+
+    def flush(self) -> BatchIngestResponse | None:
+        """Send all pending frames as one batch.
+
+        Returns:
+            The BatchIngestResponse, or None if no frames were pending.
+        """
+        if not self._pending:
+            return None
+        frames, self._pending = self._pending, []
+        return self._evaluations.ingest_batch_iter(self._evaluation_id, frames)
+
+    def __enter__(self) -> BatchAccumulator:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: object) -> None:
+        # Don't send a partial batch if the caller's loop failed
+        if exc_type is None:
+            self.flush()
 
 
 class EvaluationsResource:
     """Evaluations API resource."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: DataUpClient) -> None:
         self._client = client
 
@@ -134,16 +208,16 @@ class EvaluationsResource:
         size: int = 10,
     ) -> CursorPage[EvaluationRead]:
         """List evaluations with pagination."""
-        params: dict[str, Any] = {"size": size}
-        if cursor is not None:
-            params["cursor"] = cursor
+        params: dict[str, Any] = {
+            k: v for k, v in (("size", size), ("cursor", cursor)) if v is not None
+        }
         response = self._client._request("GET", "/evaluations/", params=params)
-        return CursorPage[EvaluationRead].model_validate(response.json())
+        return _EvaluationPage.model_validate_json(response.content)
 
     def get(self, evaluation_id: str) -> EvaluationRead:
         """Get a specific evaluation by ID."""
         response = self._client._request("GET", f"/evaluations/{evaluation_id}")
-        return EvaluationRead.model_validate(response.json())
+        return EvaluationRead.model_validate_json(response.content)
 
     def create(self, evaluation: EvaluationCreate) -> EvaluationCreateResponse:
         """Create a new evaluation.
@@ -157,9 +231,9 @@ class EvaluationsResource:
         response = self._client._request(
             "POST",
             "/evaluations/",
-            json=evaluation.model_dump(mode="json", exclude_unset=True),
+            content=evaluation.model_dump_json(exclude_unset=True).encode(),
         )
-        return EvaluationCreateResponse.model_validate(response.json())
+        return EvaluationCreateResponse.model_validate_json(response.content)
 
     def delete(self, evaluation_id: str) -> None:
         """Delete an evaluation."""
@@ -172,6 +246,11 @@ class EvaluationsResource:
     ) -> BatchIngestResponse:
         """Ingest a batch of frames into an evaluation.
 
+        The request body is serialized and streamed frame by frame, so large
+        batches are not buffered in memory as a single JSON document. With
+        ``gzip_batches`` enabled on the client, bodies of at least
+        ``GZIP_MIN_SIZE`` bytes are gzip-compressed as they are sent.
+
         Args:
             evaluation_id: ID of the evaluation.
             batch: BatchIngestRequest with frame data.
@@ -179,12 +258,65 @@ class EvaluationsResource:
         Returns:
             BatchIngestResponse with processing status.
         """
+        return self.ingest_batch_iter(evaluation_id, batch.frames)
+
+    def ingest_batch_iter(
+        self,
+        evaluation_id: str,
+        frames: Iterable[FrameData],
+    ) -> BatchIngestResponse:
+        """Ingest frames into an evaluation as a single streamed batch.
+
+        Unlike :meth:`ingest_batch`, no ``BatchIngestRequest`` is built: frames
+        are serialized one at a time as the request body is sent, so a
+        generator of frames keeps memory use flat regardless of batch size.
+        With ``gzip_batches`` enabled on the client, bodies of at least
+        ``GZIP_MIN_SIZE`` bytes are gzip-compressed as they are sent.
+
+        Args:
+            evaluation_id: ID of the evaluation.
+            frames: Frames to ingest, consumed lazily.
+
+        Returns:
+            BatchIngestResponse with processing status.
+        """
+        chunks = _iter_frames_json(frames)
+        headers = None
+        if self._client.gzip_batches:
+            chunks, headers = _gzip_batch_chunks(chunks)
         response = self._client._request(
             "POST",
             f"/evaluations/{evaluation_id}/batches",
-            json=batch.model_dump(mode="json", exclude_unset=True),
+            content=chunks,
+            headers=headers,
         )
-        return BatchIngestResponse.model_validate(response.json())
+        return BatchIngestResponse.model_validate_json(response.content)
+
+    def batched_ingest(
+        self,
+        evaluation_id: str,
+        *,
+        max_frames: int = 256,
+        max_delay: float = 0.5,
+    ) -> BatchAccumulator:
+        """Ingest frames one at a time, sending them to the API in batches.
+
+        Example:
+            ```python
+            with client.evaluations.batched_ingest(evaluation_id) as batch:
+                for frame in frames:
+                    batch.add_frame(frame)
+            ```
+
+        Args:
+            evaluation_id: ID of the evaluation.
+            max_frames: Send a batch once this many frames are pending.
+            max_delay: Send a batch once its oldest frame has waited this many seconds.
+
+        Returns:
+            A BatchAccumulator to use as a context manager.
+        """
+        return BatchAccumulator(self, evaluation_id, max_frames=max_frames, max_delay=max_delay)
 
     def finalize(self, evaluation_id: str) -> FinalizeResponse:
         """Finalize an evaluation and compute COCO metrics.
@@ -201,7 +333,7 @@ class EvaluationsResource:
             "POST",
             f"/evaluations/{evaluation_id}/finalize",
         )
-        return FinalizeResponse.model_validate(response.json())
+        return FinalizeResponse.model_validate_json(response.content)
 
     def get_frames(
         self,
@@ -222,17 +354,38 @@ class EvaluationsResource:
         Returns:
             CursorPage of EvaluationFrameRead objects.
         """
-        params: dict[str, Any] = {"size": size}
-        if job_id is not None:
-            params["job_id"] = job_id
-        if cursor is not None:
-            params["cursor"] = cursor
+        params: dict[str, Any] = {
+            k: v
+            for k, v in (("size", size), ("job_id", job_id), ("cursor", cursor))
+            if v is not None
+        }
         response = self._client._request(
             "GET",
             f"/evaluations/{evaluation_id}/frames",
             params=params,
         )
-        return CursorPage[EvaluationFrameRead].model_validate(response.json())
+        return _EvaluationFramePage.model_validate_json(response.content)
+
+    def iter_frames(
+        self,
+        evaluation_id: str,
+        *,
+        job_id: int | None = None,
+        size: int = 100,
+    ) -> Iterator[EvaluationFrameRead]:
+        """Iterate over all frames of an evaluation, following cursors.
+
+        Only one page of frames is held in memory at a time.
+
+        Args:
+            evaluation_id: ID of the evaluation.
+            job_id: Optional job ID to filter frames.
+            size: Number of frames requested per page.
+
+        Yields:
+            EvaluationFrameRead objects in server order.
+        """
+        return paginate(partial(self.get_frames, evaluation_id), job_id=job_id, size=size)
 
     def get_job_metrics(
         self,
@@ -255,11 +408,31 @@ class EvaluationsResource:
             f"/evaluations/{evaluation_id}/job_metrics",
             params=params,
         )
-        return JobMetricsResponse.model_validate(response.json())
+        return JobMetricsResponse.model_validate_json(response.content)
 
 
 class DataUpClient(BaseClient):
-    """Synchronous DataUp API client."""
+    """Synchronous DataUp API client.
+
+    By default the underlying ``httpx.Client`` negotiates HTTP/2 and keeps a
+    pool of connections alive between calls. Pass ``http2=False`` or custom
+    ``limits`` to tune the connection pool, or share one pool between several
+    clients by passing the same ``httpx.HTTPTransport`` as ``transport``. A
+    shared transport is not closed by :meth:`close`; its owner must close it.
+    The transport's own HTTP/2 and pool settings take precedence: ``http2``
+    and ``limits`` are ignored when ``transport`` is given.
+
+    Each call blocks until its response arrives. To fan out many requests
+    concurrently (e.g. fetching many agents or running many inferences), use
+    :class:`~dataup.AsyncDataUpClient` and its ``get_many``/``infer_many``
+    helpers instead.
+
+    Pass ``gzip_batches=True`` to gzip-compress batch ingest bodies of at
+    least ``GZIP_MIN_SIZE`` bytes when the API deployment accepts
+    ``Content-Encoding: gzip`` requests.
+    """
+
+    __slots__ = ("_client", "_shared_transport", "_closed", "agents", "evaluations")
 
     agents: AgentsResource
     evaluations: EvaluationsResource
@@ -271,12 +444,22 @@ class DataUpClient(BaseClient):
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         http_client: httpx.Client | None = None,
+        http2: bool = True,
+        limits: httpx.Limits | None = None,
+        transport: httpx.BaseTransport | None = None,
+        gzip_batches: bool = False,
     ) -> None:
-        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        super().__init__(api_key, base_url=base_url, timeout=timeout, gzip_batches=gzip_batches)
 
+        self._shared_transport = http_client is None and transport is not None
+        # A caller-supplied http_client is the caller's to close
+        self._closed = http_client is not None
         self._client = http_client or httpx.Client(
             timeout=self.timeout,
             headers=self._headers,
+            http2=http2,
+            limits=limits or DEFAULT_LIMITS,
+            transport=transport,
         )
 
         # Initialize resources
@@ -290,10 +473,24 @@ class DataUpClient(BaseClient):
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        content: str | bytes | Iterator[bytes] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        """Make HTTP request and handle errors."""
-        url = self._build_url(path)
-        response = self._client.request(method, url, params=params, json=json)
+        """Make HTTP request and handle errors.
+
+        Pre-serialized JSON bodies (e.g. from ``model_dump_json``) should be
+        passed as ``content`` to skip re-encoding them in httpx. An iterator
+        of chunks is sent as a streamed body.
+        """
+        request = self._client.build_request(
+            method,
+            self._url_prefix + path,
+            params=params,
+            json=json,
+            content=content,
+            headers=headers,
+        )
+        response = self._client.send(request)
         self._handle_response(response)
         return response
 
@@ -303,30 +500,26 @@ class DataUpClient(BaseClient):
             return
 
         status_code = response.status_code
+        message = response.text
+        # Decode regardless of content type: error bodies also arrive as
+        # application/problem+json or with no content type at all
         try:
-            error_data = response.json()
-            message = error_data.get("detail", error_data.get("message", response.text))
+            error_data = _json_loads(response.content)
+            message = error_data.get("detail", error_data.get("message", message))
         except Exception:
-            message = response.text
-
-        if status_code == 400:
-            raise ValidationError(message, status_code=status_code)
-        elif status_code == 401:
-            raise AuthenticationError(message, status_code=status_code)
-        elif status_code == 403:
-            raise PermissionDeniedError(message, status_code=status_code)
-        elif status_code == 404:
-            raise NotFoundError(message, status_code=status_code)
-        elif status_code == 409:
-            raise ConflictError(message, status_code=status_code)
-        elif status_code == 429:
-            raise RateLimitError(message, status_code=status_code)
-        else:
-            raise DataUpAPIError(message, status_code=status_code)
+            pass
+
+        exc_cls = _STATUS_EXCEPTIONS.get(status_code, DataUpAPIError)
+        raise exc_cls(message, status_code=status_code)
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client.
+
+        A transport passed in via ``transport`` is left open for its other users.
+        """
+        if not self._shared_transport:
+            self._client.close()
+        self._closed = True
 
     def __enter__(self) -> DataUpClient:
         return self
@@ -2,46 +2,108 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC
+from typing import Any
+
+import httpx
+
+from dataup._base import _warn_unclosed
 
 DEFAULT_CVAT_URL = "https://app.cvat.ai"
 DEFAULT_TIMEOUT = 60.0
 API_VERSION = "api"
+# Chunk size used when streaming large downloads to a file
+STREAM_CHUNK_SIZE = 1 << 20
+# Rate-limited (429) requests are retried this many times by default
+DEFAULT_MAX_RETRIES = 3
+# Base of the exponential backoff when a 429 carries no usable Retry-After
+RETRY_BACKOFF = 0.5
+# Upper bound on any single wait before retrying a 429
+MAX_RETRY_DELAY = 30.0
+# Parsed resources kept for conditional GETs (If-None-Match) per client
+ETAG_CACHE_SIZE = 32
 
 
 class BaseCVATClient(ABC):
     """Abstract base class for CVAT API clients."""
 
     def __init__(
-        self, api_token: str, *, base_url: str = DEFAULT_CVAT_URL, timeout: float = DEFAULT_TIMEOUT
+        self,
+        api_token: str,
+        *,
+        base_url: str = DEFAULT_CVAT_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache_etags: bool = False,
     ) -> None:
         self.api_token = api_token
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.max_retries = max_retries
         self._validate_token()
+        # Headers and the URL prefix never change after construction, so build them once
+        self._headers_cached = {"Authorization": f"Bearer {self.api_token}"}
+        self._json_headers_cached = {**self._headers_cached, "Content-Type": "application/json"}
+        self._url_prefix = f"{self.base_url}/{API_VERSION}/"
+        # (path, params) -> (ETag, parsed value) for resources fetched conditionally;
+        # None unless the caller opted in, since entries can be whole annotation sets
+        self._etag_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[str, Any]] | None
+        self._etag_cache = {} if cache_etags else None
+        self._etag_lock = threading.Lock()
 
     def _validate_token(self) -> None:
         """Validate API token is provided."""
         if not self.api_token:
             raise ValueError("API token is required")
 
+    def __del__(self) -> None:
+        _warn_unclosed(self)
+
     @property
     def _headers(self) -> dict[str, str]:
         """Get default headers for requests."""
-        return {
-            "Authorization": f"Bearer {self.api_token}",
-            # "Accept": "application/json",
-        }
+        return self._headers_cached
 
     @property
     def _json_headers(self) -> dict[str, str]:
         """Get headers for JSON requests."""
-        return {
-            **self._headers,
-            "Content-Type": "application/json",
-        }
+        return self._json_headers_cached
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
-        path = path.lstrip("/")
-        return f"{self.base_url}/{API_VERSION}/{path}"
+        return self._url_prefix + path.lstrip("/")
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request.
+
+        Honours a numeric ``Retry-After`` header and otherwise backs off
+        exponentially; either way the wait is capped at ``MAX_RETRY_DELAY``.
+        """
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return min(RETRY_BACKOFF * 2**attempt, MAX_RETRY_DELAY)
+
+    @staticmethod
+    def _etag_key(
+        path: str, params: dict[str, Any] | None
+    ) -> tuple[str, tuple[tuple[str, Any], ...]]:
+        """Key a conditional GET by path and query parameters."""
+        return path, tuple(sorted(params.items())) if params else ()
+
+    def _remember_etag(
+        self, key: tuple[str, tuple[tuple[str, Any], ...]], etag: str, value: Any
+    ) -> None:
+        """Cache a parsed resource under its ETag, evicting the oldest entry when full."""
+        if self._etag_cache is None:
+            return
+        with self._etag_lock:
+            self._etag_cache.pop(key, None)
+            if len(self._etag_cache) >= ETAG_CACHE_SIZE:
+                # Evict the oldest entry; dicts keep insertion order
+                del self._etag_cache[next(iter(self._etag_cache))]
+            self._etag_cache[key] = (etag, value)
@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, AsyncIterator
+import asyncio
+import os
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    TypeVar,
+)
 
 import httpx
 
-from dataup.cvat._base import DEFAULT_CVAT_URL, DEFAULT_TIMEOUT, BaseCVATClient
+from dataup._base import DEFAULT_LIMITS, _json_loads
+from dataup.cvat._base import (
+    DEFAULT_CVAT_URL,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_TIMEOUT,
+    STREAM_CHUNK_SIZE,
+    BaseCVATClient,
+)
 from dataup.cvat.exceptions import (
     CVATAPIError,
     CVATAuthenticationError,
@@ -17,20 +37,68 @@ from dataup.cvat.exceptions import (
     CVATTimeoutError,
     CVATValidationError,
 )
-from dataup.cvat.models.annotations import Annotations, FrameLabels
+from dataup.cvat.models.annotations import Annotations, FrameLabels, Shape
 from dataup.cvat.models.common import PaginatedResponse
 from dataup.cvat.models.frames import DataMetaInfo, FrameImage
 from dataup.cvat.models.jobs import Job, JobSummary
 from dataup.cvat.models.tasks import CVATLabel, Task, TaskSummary
-from dataup.cvat.utils import shape_to_label
+from dataup.cvat.utils import _index_labels, _job_lookup, _parse_labels, _shapes_to_labels
 
 if TYPE_CHECKING:
     from dataup.cvat.models.enums import AnnotationFormat
 
+# Concrete page types are built once at import rather than on every call
+_TaskPage = PaginatedResponse[TaskSummary]
+_JobPage = PaginatedResponse[JobSummary]
+
+# Frame downloads kept in flight by iter_frames
+DEFAULT_FRAME_CONCURRENCY = 8
+# Job annotation fetches kept in flight by iter_jobs_with_annotations
+DEFAULT_JOB_CONCURRENCY = 4
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+
+async def _map_in_order(
+    func: Callable[[A], Awaitable[T]], args: Iterable[A], concurrency: int
+) -> AsyncIterator[T]:
+    """Run ``func`` over ``args`` with up to ``concurrency`` calls in flight.
+
+    Results are yielded in the same order as ``args``, which is consumed lazily.
+    """
+    pending: deque[asyncio.Task[T]] = deque()
+    args = iter(args)
+    try:
+        for arg in args:
+            pending.append(asyncio.ensure_future(func(arg)))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            result = await pending.popleft()
+            for arg in args:
+                pending.append(asyncio.ensure_future(func(arg)))
+                break
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _write_chunks(chunks: AsyncIterator[bytes], dest: IO[bytes]) -> int:
+    """Write body chunks to ``dest``, returning the number of bytes written."""
+    written = 0
+    async for chunk in chunks:
+        dest.write(chunk)
+        written += len(chunk)
+    return written
+
 
 class AsyncTasksResource:
     """Async Tasks API resource."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AsyncCVATClient) -> None:
         self._client = client
 
@@ -64,32 +132,43 @@ class AsyncTasksResource:
             params["status"] = status
 
         response = await self._client._request("GET", "/tasks", params=params)
-        data = response.json()
-        return PaginatedResponse[TaskSummary](
-            count=data["count"],
-            next=data.get("next"),
-            previous=data.get("previous"),
-            results=[TaskSummary.model_validate(t) for t in data["results"]],
-        )
+        return _TaskPage.model_validate_json(response.content)
 
-    async def get(self, task_id: int) -> Task:
+    async def get(self, task_id: int, *, include_jobs: bool = True) -> Task:
         """Get a specific task by ID.
 
         Args:
             task_id: The task ID.
+            include_jobs: Also fetch the task's jobs into ``task.jobs``. This
+                costs a second request; pass False when only task metadata is needed.
 
         Returns:
-            The task details with jobs populated.
+            The task details, with jobs populated if ``include_jobs`` is set.
         """
-        response = await self._client._request("GET", f"/tasks/{task_id}")
-        task = Task.model_validate(response.json())
+        if not include_jobs:
+            response = await self._client._request("GET", f"/tasks/{task_id}")
+            return Task.model_validate_json(response.content)
 
-        # Fetch jobs separately since API doesn't include them in task response
-        jobs_response = await self._client.jobs.list(task_id=task_id, page_size=1000)
-        task.jobs = jobs_response.results
+        # Fetch jobs alongside the task since the API doesn't include them in the task response
+        response, jobs = await asyncio.gather(
+            self._client._request("GET", f"/tasks/{task_id}"), self._list_all_jobs(task_id)
+        )
+        task = Task.model_validate_json(response.content)
+        task.jobs = jobs
 
         return task
 
+    async def _list_all_jobs(self, task_id: int) -> list[JobSummary]:
+        """List every job of a task, following pagination past the first page."""
+        jobs: list[JobSummary] = []
+        page = 1
+        while True:
+            jobs_response = await self._client.jobs.list(task_id=task_id, page=page, page_size=1000)
+            jobs.extend(jobs_response.results)
+            if jobs_response.next is None:
+                return jobs
+            page += 1
+
     async def get_task_labels(self, task_id: int) -> list[CVATLabel]:
         """Get all labels for a task.
 
@@ -99,18 +178,7 @@ class AsyncTasksResource:
         Returns:
             List of CVATLabel objects for the task.
         """
-        response = await self._client._request("GET", "/labels", params={"task_id": task_id})
-        data = response.json()
-        # Handle both paginated response and direct list
-        if isinstance(data, dict) and "results" in data:
-            # Paginated response
-            return [CVATLabel.model_validate(label_data) for label_data in data["results"]]
-        elif isinstance(data, list):
-            # Direct list response
-            return [CVATLabel.model_validate(label_data) for label_data in data]
-        else:
-            # Single item or unexpected format
-            return [CVATLabel.model_validate(data)]
+        return await self._client._get_cached("/labels", _parse_labels, params={"task_id": task_id})
 
     async def get_data_meta(self, task_id: int) -> DataMetaInfo:
         """Get data metadata for a task (frame info, dimensions, etc.).
@@ -121,8 +189,9 @@ class AsyncTasksResource:
         Returns:
             Data metadata including frame information.
         """
-        response = await self._client._request("GET", f"/tasks/{task_id}/data/meta")
-        return DataMetaInfo.model_validate(response.json())
+        return await self._client._get_cached(
+            f"/tasks/{task_id}/data/meta", DataMetaInfo.model_validate_json
+        )
 
     async def get_frame(
         self, task_id: int, frame_id: int, *, quality: str = "original"
@@ -151,6 +220,7 @@ class AsyncTasksResource:
         start_frame: int | None = None,
         stop_frame: int | None = None,
         quality: str = "original",
+        concurrency: int = DEFAULT_FRAME_CONCURRENCY,
     ) -> AsyncIterator[FrameImage]:
         """Iterate through frames in a task.
 
@@ -159,6 +229,7 @@ class AsyncTasksResource:
             start_frame: Starting frame number (inclusive). Defaults to task's start frame.
             stop_frame: Ending frame number (inclusive). Defaults to task's stop frame.
             quality: Image quality - "original" or "compressed".
+            concurrency: Maximum number of frame downloads in flight at once.
 
         Yields:
             Frame images in order.
@@ -167,9 +238,14 @@ class AsyncTasksResource:
         start = start_frame if start_frame is not None else meta.start_frame
         stop = stop_frame if stop_frame is not None else meta.stop_frame
 
-        for frame_id in range(start, stop + 1):
-            if frame_id not in meta.deleted_frames:
-                yield await self.get_frame(task_id, frame_id, quality=quality)
+        deleted = set(meta.deleted_frames)
+        frame_ids = (f for f in range(start, stop + 1) if f not in deleted)
+
+        async def fetch(frame_id: int) -> FrameImage:
+            return await self.get_frame(task_id, frame_id, quality=quality)
+
+        async for frame in _map_in_order(fetch, frame_ids, concurrency):
+            yield frame
 
     async def get_annotations(self, task_id: int) -> list[FrameLabels]:
         """Get all annotations for a task.
@@ -180,59 +256,60 @@ class AsyncTasksResource:
         Returns:
             List of FrameLabels, one per frame with annotations.
         """
-        # Get annotations
-        response = await self._client._request("GET", f"/tasks/{task_id}/annotations")
-        annotations = Annotations.model_validate(response.json())
+        return [frame_labels async for frame_labels in self.iter_annotations(task_id)]
 
-        # Get task to resolve label names and get jobs
-        task = await self.get(task_id)
+    async def iter_annotations(self, task_id: int) -> AsyncIterator[FrameLabels]:
+        """Iterate over a task's annotations one frame at a time.
 
-        # Get CVAT labels for attribute resolution
-        cvat_labels = await self.get_task_labels(task_id)
+        The annotations are fetched once up front; each frame's labels are
+        only built when it is reached, so callers can stop early without
+        converting the rest.
+
+        Args:
+            task_id: The task ID.
+
+        Yields:
+            FrameLabels, one per frame with annotations.
+        """
+        annotations, jobs, cvat_labels = await self._fetch_annotations(task_id)
 
         # Create frame -> job_id mapping
-        # Get all jobs for the task to map frames to jobs
-        jobs_response = await self._client.jobs.list(task_id=task_id, page_size=1000)
-        frame_to_job: dict[int, int] = {}
-        for job_summary in jobs_response.results:
-            for frame_id in range(job_summary.start_frame, job_summary.stop_frame + 1):
-                frame_to_job[frame_id] = job_summary.id
+        job_for_frame = _job_lookup(jobs)
 
         # Group shapes by frame
-        frames_shapes: dict[int, list[dict[str, Any]]] = {}
+        frames_shapes: defaultdict[int, list[Shape]] = defaultdict(list)
         for shape in annotations.shapes:
-            frame_id = shape.frame
-            if frame_id not in frames_shapes:
-                frames_shapes[frame_id] = []
-            # Convert Shape to dict for shape_to_label
-            shape_dict = shape.model_dump()
-            frames_shapes[frame_id].append(shape_dict)
-
-        # Convert to FrameLabels
-        frame_labels_list: list[FrameLabels] = []
+            frames_shapes[shape.frame].append(shape)
+
+        # Convert to FrameLabels, resolving labels through one ID index
+        label_index = _index_labels(cvat_labels)
         for frame_id, shapes in frames_shapes.items():
             # Get job_id for this frame (default to first job if not found)
-            job_id = frame_to_job.get(frame_id)
-            if job_id is None and task.jobs:
+            job_id = job_for_frame(frame_id)
+            if job_id is None and jobs:
                 # Fallback: use first job if frame not mapped
-                job_id = task.jobs[0].id
+                job_id = jobs[0].id
             elif job_id is None:
                 # If no jobs, we can't create FrameLabels - skip
                 continue
 
-            # Convert shapes to Labels
-            labels = []
-            for shape_dict in shapes:
-                try:
-                    label = shape_to_label(shape_dict, cvat_labels)
-                    labels.append(label)
-                except Exception:
-                    # Skip shapes that can't be converted
-                    continue
-
-            frame_labels_list.append(FrameLabels(frame_id=frame_id, job_id=job_id, labels=labels))
-
-        return frame_labels_list
+            labels = _shapes_to_labels(shapes, cvat_labels, label_index)
+            yield FrameLabels(frame_id=frame_id, job_id=job_id, labels=labels)
+
+    async def _fetch_annotations(
+        self, task_id: int
+    ) -> tuple[Annotations, list[JobSummary], list[CVATLabel]]:
+        """Fetch a task's raw annotations with the jobs and labels needed to resolve them."""
+        # Fetch annotations, the task's jobs and the CVAT labels (for
+        # attribute resolution) concurrently
+        annotations, jobs, cvat_labels = await asyncio.gather(
+            self._client._get_cached(
+                f"/tasks/{task_id}/annotations", Annotations.model_validate_json
+            ),
+            self._list_all_jobs(task_id),
+            self.get_task_labels(task_id),
+        )
+        return annotations, jobs, cvat_labels
 
     async def get_frame_annotations(self, task_id: int, frame_id: int) -> FrameLabels:
         """Get annotations for a specific frame in a task.
@@ -244,16 +321,20 @@ class AsyncTasksResource:
         Returns:
             FrameLabels for the specified frame.
         """
-        frame_labels_list = await self.get_annotations(task_id)
-        # Find the FrameLabels for this frame_id
-        for frame_labels in frame_labels_list:
-            if frame_labels.frame_id == frame_id:
-                return frame_labels
-        # If not found, return empty FrameLabels
-        # Need to get job_id - use first job from task
-        task = await self.get(task_id)
-        job_id = task.jobs[0].id if task.jobs else 0
-        return FrameLabels(frame_id=frame_id, job_id=job_id, labels=[])
+        annotations, jobs, cvat_labels = await self._fetch_annotations(task_id)
+        # Only the requested frame's shapes are converted
+        shapes = [shape for shape in annotations.shapes if shape.frame == frame_id]
+        if not shapes or not jobs:
+            # Need to get job_id - use first job from task
+            job_id = jobs[0].id if jobs else 0
+            return FrameLabels(frame_id=frame_id, job_id=job_id, labels=[])
+
+        job_id = _job_lookup(jobs)(frame_id)
+        if job_id is None:
+            job_id = jobs[0].id
+        return FrameLabels(
+            frame_id=frame_id, job_id=job_id, labels=_shapes_to_labels(shapes, cvat_labels)
+        )
 
     async def export_annotations(self, task_id: int, format: AnnotationFormat | str) -> bytes:
         """Export annotations in a specific format.
@@ -263,7 +344,9 @@ class AsyncTasksResource:
             format: Export format (e.g., AnnotationFormat.COCO).
 
         Returns:
-            Exported annotation data as bytes (typically a ZIP archive).
+            Exported annotation data as bytes (typically a ZIP archive). The
+            whole export is held in memory; use :meth:`export_annotations_to`
+            for large tasks.
         """
         format_str = format.value if hasattr(format, "value") else format
         params = {"format": format_str, "action": "download"}
@@ -276,10 +359,43 @@ class AsyncTasksResource:
         )
         return response.content
 
+    async def export_annotations_to(
+        self,
+        task_id: int,
+        format: AnnotationFormat | str,
+        dest: IO[bytes] | str | os.PathLike[str],
+    ) -> int:
+        """Export annotations in a specific format, streaming them to a file.
+
+        Unlike :meth:`export_annotations`, the export is written in chunks as
+        it downloads and is never held in memory as a whole, which matters for
+        large tasks.
+
+        Args:
+            task_id: The task ID.
+            format: Export format (e.g., AnnotationFormat.COCO).
+            dest: Path to write to, or a binary file object.
+
+        Returns:
+            Number of bytes written.
+        """
+        format_str = format.value if hasattr(format, "value") else format
+        params = {"format": format_str, "action": "download"}
+
+        async with self._client._stream(
+            "GET", f"/tasks/{task_id}/annotations", params=params
+        ) as response:
+            if isinstance(dest, (str, os.PathLike)):
+                with open(dest, "wb") as f:
+                    return await _write_chunks(response.aiter_bytes(STREAM_CHUNK_SIZE), f)
+            return await _write_chunks(response.aiter_bytes(STREAM_CHUNK_SIZE), dest)
+
 
 class AsyncJobsResource:
     """Async Jobs API resource."""
 
+    __slots__ = ("_client",)
+
     def __init__(self, client: AsyncCVATClient) -> None:
         self._client = client
 
@@ -301,13 +417,7 @@ class AsyncJobsResource:
             params["task_id"] = task_id
 
         response = await self._client._request("GET", "/jobs", params=params)
-        data = response.json()
-        return PaginatedResponse[JobSummary](
-            count=data["count"],
-            next=data.get("next"),
-            previous=data.get("previous"),
-            results=[JobSummary.model_validate(j) for j in data["results"]],
-        )
+        return _JobPage.model_validate_json(response.content)
 
     async def get(self, job_id: int) -> Job:
         """Get a specific job by ID.
@@ -319,7 +429,7 @@ class AsyncJobsResource:
             The job details.
         """
         response = await self._client._request("GET", f"/jobs/{job_id}")
-        return Job.model_validate(response.json())
+        return Job.model_validate_json(response.content)
 
     async def get_job_labels(self, job_id: int) -> list[CVATLabel]:
         """Get all labels for a job.
@@ -330,14 +440,7 @@ class AsyncJobsResource:
         Returns:
             List of CVATLabel objects for the job.
         """
-        response = await self._client._request("GET", "/labels", params={"job_id": job_id})
-        data = response.json()
-        if isinstance(data, dict) and "results" in data:
-            return [CVATLabel.model_validate(label_data) for label_data in data["results"]]
-        elif isinstance(data, list):
-            return [CVATLabel.model_validate(label_data) for label_data in data]
-        else:
-            return [CVATLabel.model_validate(data)]
+        return await self._client._get_cached("/labels", _parse_labels, params={"job_id": job_id})
 
     async def get_data_meta(self, job_id: int) -> DataMetaInfo:
         """Get data metadata for a job.
@@ -348,8 +451,9 @@ class AsyncJobsResource:
         Returns:
             Data metadata including frame information.
         """
-        response = await self._client._request("GET", f"/jobs/{job_id}/data/meta")
-        return DataMetaInfo.model_validate(response.json())
+        return await self._client._get_cached(
+            f"/jobs/{job_id}/data/meta", DataMetaInfo.model_validate_json
+        )
 
     async def get_frame(
         self, job_id: int, frame_id: int, *, quality: str = "original"
@@ -377,23 +481,32 @@ class AsyncJobsResource:
         )
 
     async def iter_frames(
-        self, job_id: int, *, quality: str = "original"
+        self,
+        job_id: int,
+        *,
+        quality: str = "original",
+        concurrency: int = DEFAULT_FRAME_CONCURRENCY,
     ) -> AsyncIterator[FrameImage]:
         """Iterate through frames in a job.
 
         Args:
             job_id: The job ID.
             quality: Image quality - "original" or "compressed".
+            concurrency: Maximum number of frame downloads in flight at once.
 
         Yields:
             Frame images in order.
         """
-        job = await self.get(job_id)
-        meta = await self.get_data_meta(job_id)
+        job, meta = await asyncio.gather(self.get(job_id), self.get_data_meta(job_id))
 
-        for frame_id in range(job.start_frame, job.stop_frame + 1):
-            if frame_id not in meta.deleted_frames:
-                yield await self.get_frame(job_id, frame_id, quality=quality)
+        deleted = set(meta.deleted_frames)
+        frame_ids = (f for f in range(job.start_frame, job.stop_frame + 1) if f not in deleted)
+
+        async def fetch(frame_id: int) -> FrameImage:
+            return await self.get_frame(job_id, frame_id, quality=quality)
+
+        async for frame in _map_in_order(fetch, frame_ids, concurrency):
+            yield frame
 
     async def get_annotations(
         self, job_id: int, *, cvat_labels: list[CVATLabel] | None = None
@@ -408,35 +521,46 @@ class AsyncJobsResource:
         Returns:
             List of FrameLabels, one per frame with annotations.
         """
-        response = await self._client._request("GET", f"/jobs/{job_id}/annotations")
-        annotations = Annotations.model_validate(response.json())
+        return [
+            frame_labels
+            async for frame_labels in self.iter_annotations(job_id, cvat_labels=cvat_labels)
+        ]
+
+    async def iter_annotations(
+        self, job_id: int, *, cvat_labels: list[CVATLabel] | None = None
+    ) -> AsyncIterator[FrameLabels]:
+        """Iterate over a job's annotations one frame at a time, in frame order.
+
+        The annotations are fetched once up front; each frame's labels are
+        only built when it is reached, so callers can stop early without
+        converting the rest.
+
+        Args:
+            job_id: The job ID.
+            cvat_labels: Optional pre-fetched CVAT labels for the job.
+                If not provided, labels will be fetched automatically.
+
+        Yields:
+            FrameLabels, one per frame with annotations.
+        """
+        annotations = await self._client._get_cached(
+            f"/jobs/{job_id}/annotations", Annotations.model_validate_json
+        )
 
         # Fetch labels if not provided
         if cvat_labels is None:
             cvat_labels = await self.get_job_labels(job_id)
 
         # Group shapes by frame
-        frames_shapes: dict[int, list[dict[str, Any]]] = {}
+        frames_shapes: defaultdict[int, list[Shape]] = defaultdict(list)
         for shape in annotations.shapes:
-            frame_id = shape.frame
-            if frame_id not in frames_shapes:
-                frames_shapes[frame_id] = []
-            frames_shapes[frame_id].append(shape.model_dump())
+            frames_shapes[shape.frame].append(shape)
 
-        # Convert to FrameLabels
-        frame_labels_list: list[FrameLabels] = []
+        # Convert to FrameLabels, resolving labels through one ID index
+        label_index = _index_labels(cvat_labels)
         for frame_id, shapes in sorted(frames_shapes.items()):
-            labels = []
-            for shape_dict in shapes:
-                try:
-                    label = shape_to_label(shape_dict, cvat_labels)
-                    labels.append(label)
-                except Exception:
-                    continue
-
-            frame_labels_list.append(FrameLabels(frame_id=frame_id, job_id=job_id, labels=labels))
-
-        return frame_labels_list
+            labels = _shapes_to_labels(shapes, cvat_labels, label_index)
+            yield FrameLabels(frame_id=frame_id, job_id=job_id, labels=labels)
 
     async def get_annotations_raw(self, job_id: int) -> Annotations:
         """Get raw CVAT annotations for a job.
@@ -447,8 +571,9 @@ class AsyncJobsResource:
         Returns:
             Raw CVAT Annotations object (shapes, tracks, tags).
         """
-        response = await self._client._request("GET", f"/jobs/{job_id}/annotations")
-        return Annotations.model_validate(response.json())
+        return await self._client._get_cached(
+            f"/jobs/{job_id}/annotations", Annotations.model_validate_json
+        )
 
     async def get_frame_annotations(
         self, job_id: int, frame_id: int, *, cvat_labels: list[CVATLabel] | None = None
@@ -463,42 +588,70 @@ class AsyncJobsResource:
         Returns:
             FrameLabels for the specified frame.
         """
-        frame_labels_list = await self.get_annotations(job_id, cvat_labels=cvat_labels)
-        for frame_labels in frame_labels_list:
-            if frame_labels.frame_id == frame_id:
-                return frame_labels
-        return FrameLabels(frame_id=frame_id, job_id=job_id, labels=[])
+        annotations = await self.get_annotations_raw(job_id)
+        # Only the requested frame's shapes are converted
+        shapes = [shape for shape in annotations.shapes if shape.frame == frame_id]
+        if not shapes:
+            return FrameLabels(frame_id=frame_id, job_id=job_id, labels=[])
+
+        if cvat_labels is None:
+            cvat_labels = await self.get_job_labels(job_id)
+        return FrameLabels(
+            frame_id=frame_id, job_id=job_id, labels=_shapes_to_labels(shapes, cvat_labels)
+        )
 
     async def iter_jobs_with_annotations(
-        self, task_id: int, *, page_size: int = 100
+        self,
+        task_id: int,
+        *,
+        page_size: int = 100,
+        concurrency: int = DEFAULT_JOB_CONCURRENCY,
     ) -> AsyncIterator[tuple[JobSummary, list[FrameLabels]]]:
         """Iterate over all jobs for a task with their annotations.
 
         This method is optimized for fetching annotations across multiple jobs,
         useful for submitting evaluations. It fetches labels once per task
-        and reuses them for all jobs.
+        and reuses them for all jobs, keeps several jobs' annotations
+        downloading while earlier ones are consumed, and requests the next
+        page of jobs while the current one is processed.
 
         Args:
             task_id: The task ID.
             page_size: Number of jobs to fetch per page.
+            concurrency: Maximum number of annotation fetches in flight at once.
 
         Yields:
-            Tuples of (JobSummary, list[FrameLabels]) for each job.
+            Tuples of (JobSummary, list[FrameLabels]) for each job, in order.
         """
-        # Fetch labels once for the task (shared across all jobs)
-        cvat_labels = await self._client.tasks.get_task_labels(task_id)
+        # Fetch labels once for the task (shared across all jobs), alongside the first page
+        cvat_labels, jobs_response = await asyncio.gather(
+            self._client.tasks.get_task_labels(task_id),
+            self.list(task_id=task_id, page=1, page_size=page_size),
+        )
+
+        async def fetch(job_summary: JobSummary) -> tuple[JobSummary, list[FrameLabels]]:
+            return job_summary, await self.get_annotations(job_summary.id, cvat_labels=cvat_labels)
 
         # Paginate through all jobs
         page = 1
-        while True:
-            jobs_response = await self.list(task_id=task_id, page=page, page_size=page_size)
-            for job_summary in jobs_response.results:
-                annotations = await self.get_annotations(job_summary.id, cvat_labels=cvat_labels)
-                yield job_summary, annotations
-
-            if jobs_response.next is None:
-                break
-            page += 1
+        next_page: asyncio.Task[PaginatedResponse[JobSummary]] | None = None
+        try:
+            while True:
+                if jobs_response.next is not None:
+                    page += 1
+                    next_page = asyncio.ensure_future(
+                        self.list(task_id=task_id, page=page, page_size=page_size)
+                    )
+                async for item in _map_in_order(fetch, jobs_response.results, concurrency):
+                    yield item
+
+                if next_page is None:
+                    break
+                jobs_response = await next_page
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
 
 class AsyncCVATClient(BaseCVATClient):
@@ -527,6 +680,11 @@ class AsyncCVATClient(BaseCVATClient):
         base_url: str = DEFAULT_CVAT_URL,
         timeout: float = DEFAULT_TIMEOUT,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool = True,
+        limits: httpx.Limits | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        connect_retries: int = 0,
+        cache_etags: bool = False,
     ) -> None:
         """Initialize the async CVAT client.
 
@@ -535,12 +693,42 @@ class AsyncCVATClient(BaseCVATClient):
             base_url: CVAT server URL. Defaults to https://app.cvat.ai.
             timeout: Request timeout in seconds. Defaults to 60.
             http_client: Optional custom httpx.AsyncClient instance.
+            http2: Negotiate HTTP/2 so concurrent requests share one connection.
+            limits: Connection pool limits. Defaults to ``DEFAULT_LIMITS``.
+            max_retries: Times a rate-limited (429) request is retried, waiting
+                for ``Retry-After`` or an exponential backoff. 0 disables retries.
+            connect_retries: Times a failed connection attempt is retried. Off by
+                default, since retries need an explicit transport and httpx then
+                ignores ``HTTP(S)_PROXY``/``NO_PROXY`` from the environment.
+            cache_etags: Keep labels, data meta and annotations parsed from
+                responses carrying an ETag, and revalidate them with
+                If-None-Match on later reads. Worth enabling only when the same
+                resources are read repeatedly; cached values are shared.
         """
-        super().__init__(api_token, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_token,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            cache_etags=cache_etags,
+        )
 
+        # A caller-supplied http_client is the caller's to close
+        self._closed = http_client is not None
+        limits = limits or DEFAULT_LIMITS
+        # An explicit transport disables httpx's environment proxy support,
+        # so one is only built when connection retries are asked for
+        transport = (
+            httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=connect_retries)
+            if connect_retries
+            else None
+        )
         self._client = http_client or httpx.AsyncClient(
             timeout=self.timeout,
             headers=self._headers,
+            http2=http2,
+            limits=limits,
+            transport=transport,
         )
 
         # Initialize resources
@@ -555,30 +743,85 @@ class AsyncCVATClient(BaseCVATClient):
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
         accept: str = "application/json",
+        if_none_match: str | None = None,
     ) -> httpx.Response:
-        """Make async HTTP request and handle errors."""
+        """Make async HTTP request and handle errors.
+
+        With ``if_none_match``, a 304 Not Modified answer is returned as is
+        instead of being raised as an error.
+        """
         url = self._build_url(path)
         # Note: CVAT API works without explicit Accept header
-        headers = dict(self._headers)
-        if json is not None:
-            headers["Content-Type"] = "application/json"
+        headers = self._json_headers if json is not None else self._headers
+        if if_none_match is not None:
+            headers = {**headers, "If-None-Match": if_none_match}
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                )
+            except httpx.ConnectError as e:
+                raise CVATConnectionError(f"Failed to connect to CVAT: {e}") from e
+            except httpx.TimeoutException as e:
+                raise CVATTimeoutError(f"Request timed out: {e}") from e
+
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
 
+        if if_none_match is None or response.status_code != 304:
+            self._handle_response(response)
+        return response
+
+    async def _get_cached(
+        self, path: str, parse: Callable[[bytes], T], *, params: dict[str, Any] | None = None
+    ) -> T:
+        """GET a resource and parse it, revalidating a cached copy by ETag.
+
+        Without ``cache_etags`` this is a plain GET. With it, the parsed value
+        is kept per path and reused when the server answers 304 Not Modified,
+        so callers must treat returned values as read-only.
+        """
+        if self._etag_cache is None:
+            return parse((await self._request("GET", path, params=params)).content)
+
+        key = self._etag_key(path, params)
+        # Hold the entry locally so a concurrent eviction cannot lose it mid-request;
+        # without one no If-None-Match is sent, so a 304 cannot come back
+        cached = self._etag_cache.get(key)
+        etag = cached[0] if cached is not None else None
+        response = await self._request("GET", path, params=params, if_none_match=etag)
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+
+        value = parse(response.content)
+        if new_etag := response.headers.get("etag"):
+            self._remember_etag(key, new_etag, value)
+        return value
+
+    @asynccontextmanager
+    async def _stream(
+        self, method: str, path: str, *, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Make a streamed async HTTP request, raising for errors before the body is read."""
         try:
-            response = await self._client.request(
-                method,
-                url,
-                params=params,
-                json=json,
-                headers=headers,
-            )
+            async with self._client.stream(
+                method, self._build_url(path), params=params, headers=self._headers
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    self._handle_response(response)
+                yield response
         except httpx.ConnectError as e:
             raise CVATConnectionError(f"Failed to connect to CVAT: {e}") from e
         except httpx.TimeoutException as e:
             raise CVATTimeoutError(f"Request timed out: {e}") from e
 
-        self._handle_response(response)
-        return response
-
     def _handle_response(self, response: httpx.Response) -> None:
         """Handle HTTP response and raise appropriate exceptions."""
         if response.is_success:
@@ -586,7 +829,7 @@ class AsyncCVATClient(BaseCVATClient):
 
         status_code = response.status_code
         try:
-            error_data = response.json()
+            error_data = _json_loads(response.content)
             message = error_data.get("detail", error_data.get("message", response.text))
         except Exception:
             message = response.text
@@ -607,6 +850,7 @@ class AsyncCVATClient(BaseCVATClient):
     async def aclose(self) -> None:
         """Close the async HTTP client."""
         await self._client.aclose()
+        self._closed = True
 
     async def __aenter__(self) -> AsyncCVATClient:
         return self
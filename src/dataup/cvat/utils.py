@@ -2,21 +2,131 @@
 
 from __future__ import annotations
 
-from typing import Any
+from bisect import bisect_right
+from typing import Any, Callable, Iterable
 
 from dataup_models.geom import BoundingBox, Polygon
 from dataup_models.labels import Label, LabelAttribute
+from pydantic import TypeAdapter
 
+from dataup._base import _json_loads
 from dataup.cvat.models.annotations import AttributeValue, Shape
 from dataup.cvat.models.enums import ShapeType
+from dataup.cvat.models.jobs import JobSummary
 from dataup.cvat.models.tasks import CVATLabel, CVATLabelAttribute
 
+# label_id -> (label name, attribute spec_id -> CVATLabelAttribute)
+_LabelIndex = dict[int, tuple[str, dict[int, CVATLabelAttribute]]]
+
+# (bbox, polygon) derived from a shape's points
+_Geometry = tuple[BoundingBox | None, Polygon | None]
+
+# Validate whole label lists in one pass through pydantic-core
+_LABEL_LIST = TypeAdapter(list[CVATLabel])
+
+
+def _bbox_from_corners(x1: float, y1: float, x2: float, y2: float) -> BoundingBox:
+    """Build a bbox from two opposite corners given in either order."""
+    # One compare-and-swap per axis instead of separate min/max calls
+    if x1 > x2:
+        x1, x2 = x2, x1
+    if y1 > y2:
+        y1, y2 = y2, y1
+    return BoundingBox(x=int(x1), y=int(y1), width=int(x2 - x1), height=int(y2 - y1))
+
+
+def _rectangle_geometry(points: list[float]) -> _Geometry:
+    # Rectangle: points = [x1, y1, x2, y2]
+    if len(points) >= 4:
+        return _bbox_from_corners(points[0], points[1], points[2], points[3]), None
+    return None, None
+
+
+def _polygon_with_bbox(points: list[float]) -> _Geometry:
+    """Build a Polygon and its bbox from flat points in a single pass.
+
+    Matches ``Polygon.to_bbox()`` without walking the vertices a second time.
+    """
+    x_coords = [int(x) for x in points[0::2]]
+    y_coords = [int(y) for y in points[1::2]]
+    polygon = Polygon(points=list(zip(x_coords, y_coords, strict=True)))
+    x_min, y_min = min(x_coords), min(y_coords)
+    bbox = BoundingBox(x=x_min, y=y_min, width=max(x_coords) - x_min, height=max(y_coords) - y_min)
+    return bbox, polygon
+
+
+def _polygon_geometry(points: list[float]) -> _Geometry:
+    # Polygon: points = [x1, y1, x2, y2, x3, y3, ...]
+    if len(points) >= 6:  # At least 3 points (6 coordinates)
+        return _polygon_with_bbox(points)
+    return None, None
+
+
+def _polyline_geometry(points: list[float]) -> _Geometry:
+    # Polyline: similar to polygon but open
+    if len(points) >= 4:  # At least 2 points
+        return _polygon_with_bbox(points)
+    return None, None
+
+
+def _bbox_from_point_cloud(points: list[float]) -> BoundingBox | None:
+    x_coords = points[0::2]
+    y_coords = points[1::2]
+    if x_coords and y_coords:
+        x_min, x_max = min(x_coords), max(x_coords)
+        y_min, y_max = min(y_coords), max(y_coords)
+        return BoundingBox(
+            x=int(x_min),
+            y=int(y_min),
+            width=int(x_max - x_min) if x_max > x_min else 1,
+            height=int(y_max - y_min) if y_max > y_min else 1,
+        )
+    return None
+
+
+def _points_geometry(points: list[float]) -> _Geometry:
+    # Points: create bbox from point cloud
+    if len(points) >= 2:
+        return _bbox_from_point_cloud(points), None
+    return None, None
+
+
+def _ellipse_geometry(points: list[float]) -> _Geometry:
+    # Ellipse: points = [cx, cy, rx, ry] or [x1, y1, x2, y2]
+    if len(points) == 4:
+        # Assume center-radius format
+        cx, cy, rx, ry = points[0], points[1], points[2], points[3]
+        bbox = BoundingBox(x=int(cx - rx), y=int(cy - ry), width=int(2 * rx), height=int(2 * ry))
+        return bbox, None
+    if len(points) > 4:
+        # Bounding box format
+        return _bbox_from_corners(points[0], points[1], points[2], points[3]), None
+    return None, None
+
+
+def _other_geometry(points: list[float]) -> _Geometry:
+    # For other types (cuboid, skeleton, mask), try to create bbox from points
+    if len(points) >= 4:
+        return _bbox_from_point_cloud(points), None
+    return None, None
+
+
+# One dict lookup per shape instead of a chain of enum comparisons
+_SHAPE_GEOMETRY: dict[ShapeType, Callable[[list[float]], _Geometry]] = {
+    ShapeType.RECTANGLE: _rectangle_geometry,
+    ShapeType.POLYGON: _polygon_geometry,
+    ShapeType.POLYLINE: _polyline_geometry,
+    ShapeType.POINTS: _points_geometry,
+    ShapeType.ELLIPSE: _ellipse_geometry,
+}
+
 
 def shape_to_label(
     shape: dict[str, Any] | Shape,
     cvat_labels: list[CVATLabel],
     *,
     score: float = 1.0,
+    label_index: _LabelIndex | None = None,
 ) -> Label:
     # Convert dict to Shape if needed
     if isinstance(shape, dict):
@@ -35,12 +145,17 @@ def shape_to_label(
     label_attr_map: dict[int, CVATLabelAttribute] = {}  # spec_id -> CVATLabelAttribute
 
     if label_id is not None:
-        for cvat_label in cvat_labels:
-            if cvat_label.id == label_id:
-                label_name = cvat_label.name
+        # Callers converting many shapes pass a prebuilt index to skip the scan
+        if label_index is not None:
+            indexed = label_index.get(label_id)
+            if indexed is not None:
+                label_name, label_attr_map = indexed
+        else:
+            matched = next((label for label in cvat_labels if label.id == label_id), None)
+            if matched is not None:
+                label_name = matched.name
                 # Build attribute spec_id -> name mapping
-                label_attr_map = {attr.id: attr for attr in cvat_label.attributes}
-                break
+                label_attr_map = {attr.id: attr for attr in matched.attributes}
 
     # Convert attributes using CVATLabelAttribute to get proper names
     label_attributes = []
@@ -63,93 +178,7 @@ def shape_to_label(
         label_attributes.append(LabelAttribute(key=attr_key, value=attr_value))
 
     # Convert points to bbox/polygon based on shape type
-    bbox: BoundingBox | None = None
-    polygon: Polygon | None = None
-
-    if shape_type == ShapeType.RECTANGLE:
-        # Rectangle: points = [x1, y1, x2, y2]
-        if len(points) >= 4:
-            x1, y1, x2, y2 = points[0], points[1], points[2], points[3]
-            x_min = min(x1, x2)
-            y_min = min(y1, y2)
-            x_max = max(x1, x2)
-            y_max = max(y1, y2)
-            bbox = BoundingBox(
-                x=int(x_min),
-                y=int(y_min),
-                width=int(x_max - x_min),
-                height=int(y_max - y_min),
-            )
-    elif shape_type == ShapeType.POLYGON:
-        # Polygon: points = [x1, y1, x2, y2, x3, y3, ...]
-        if len(points) >= 6:  # At least 3 points (6 coordinates)
-            polygon_points = [
-                (int(points[i]), int(points[i + 1])) for i in range(0, len(points), 2)
-            ]
-            polygon = Polygon(points=polygon_points)
-            # Also create bbox from polygon
-            bbox = polygon.to_bbox()
-    elif shape_type == ShapeType.POLYLINE:
-        # Polyline: similar to polygon but open
-        if len(points) >= 4:  # At least 2 points
-            polygon_points = [
-                (int(points[i]), int(points[i + 1])) for i in range(0, len(points), 2)
-            ]
-            polygon = Polygon(points=polygon_points)
-            bbox = polygon.to_bbox()
-    elif shape_type == ShapeType.POINTS:
-        # Points: create bbox from point cloud
-        if len(points) >= 2:
-            x_coords = [points[i] for i in range(0, len(points), 2)]
-            y_coords = [points[i + 1] for i in range(0, len(points), 2)]
-            if x_coords and y_coords:
-                x_min, x_max = min(x_coords), max(x_coords)
-                y_min, y_max = min(y_coords), max(y_coords)
-                bbox = BoundingBox(
-                    x=int(x_min),
-                    y=int(y_min),
-                    width=int(x_max - x_min) if x_max > x_min else 1,
-                    height=int(y_max - y_min) if y_max > y_min else 1,
-                )
-    elif shape_type == ShapeType.ELLIPSE:
-        # Ellipse: points = [cx, cy, rx, ry] or [x1, y1, x2, y2]
-        if len(points) >= 4:
-            if len(points) == 4:
-                # Assume center-radius format
-                cx, cy, rx, ry = points[0], points[1], points[2], points[3]
-                bbox = BoundingBox(
-                    x=int(cx - rx),
-                    y=int(cy - ry),
-                    width=int(2 * rx),
-                    height=int(2 * ry),
-                )
-            else:
-                # Bounding box format
-                x1, y1, x2, y2 = points[0], points[1], points[2], points[3]
-                x_min = min(x1, x2)
-                y_min = min(y1, y2)
-                x_max = max(x1, x2)
-                y_max = max(y1, y2)
-                bbox = BoundingBox(
-                    x=int(x_min),
-                    y=int(y_min),
-                    width=int(x_max - x_min),
-                    height=int(y_max - y_min),
-                )
-    else:
-        # For other types (cuboid, skeleton, mask), try to create bbox from points
-        if len(points) >= 4:
-            x_coords = [points[i] for i in range(0, len(points), 2) if i < len(points)]
-            y_coords = [points[i + 1] for i in range(0, len(points), 2) if i + 1 < len(points)]
-            if x_coords and y_coords:
-                x_min, x_max = min(x_coords), max(x_coords)
-                y_min, y_max = min(y_coords), max(y_coords)
-                bbox = BoundingBox(
-                    x=int(x_min),
-                    y=int(y_min),
-                    width=int(x_max - x_min) if x_max > x_min else 1,
-                    height=int(y_max - y_min) if y_max > y_min else 1,
-                )
+    bbox, polygon = _SHAPE_GEOMETRY.get(shape_type, _other_geometry)(points)
 
     # Ensure we have at least a bbox
     if bbox is None:
@@ -163,3 +192,71 @@ def shape_to_label(
         polygon=polygon,
         attributes=label_attributes,
     )
+
+
+def _parse_labels(content: bytes) -> list[CVATLabel]:
+    """Parse a /labels response body, paginated or a plain list, into CVATLabels."""
+    data = _json_loads(content)
+    if isinstance(data, dict) and "results" in data:
+        items = data["results"]
+    elif isinstance(data, list):
+        items = data
+    else:
+        # Single item or unexpected format
+        items = [data]
+    return _LABEL_LIST.validate_python(items)
+
+
+def _index_labels(cvat_labels: list[CVATLabel]) -> _LabelIndex:
+    """Index label names and attribute maps by label ID.
+
+    Keeps the first of any duplicate IDs, like the linear scan in
+    :func:`shape_to_label`.
+    """
+    label_index: _LabelIndex = {}
+    for cvat_label in cvat_labels:
+        if cvat_label.id not in label_index:
+            label_index[cvat_label.id] = (
+                cvat_label.name,
+                {attr.id: attr for attr in cvat_label.attributes},
+            )
+    return label_index
+
+
+def _shapes_to_labels(
+    shapes: Iterable[Shape],
+    cvat_labels: list[CVATLabel],
+    label_index: _LabelIndex | None = None,
+) -> list[Label]:
+    """Convert shapes to Labels, skipping shapes that can't be converted.
+
+    Pass ``label_index`` from :func:`_index_labels` when converting several
+    batches against the same labels.
+    """
+    if label_index is None:
+        label_index = _index_labels(cvat_labels)
+    labels = []
+    for shape in shapes:
+        try:
+            labels.append(shape_to_label(shape, cvat_labels, label_index=label_index))
+        except Exception:
+            continue
+    return labels
+
+
+def _job_lookup(jobs: Iterable[JobSummary]) -> Callable[[int], int | None]:
+    """Build a frame -> job ID lookup over the jobs' frame ranges.
+
+    Bisects the sorted range starts instead of expanding every range into a
+    dict, so memory grows with the number of jobs rather than frames.
+    """
+    ordered = sorted(jobs, key=lambda job: job.start_frame)
+    starts = [job.start_frame for job in ordered]
+
+    def lookup(frame_id: int) -> int | None:
+        index = bisect_right(starts, frame_id) - 1
+        if index >= 0 and frame_id <= ordered[index].stop_frame:
+            return ordered[index].id
+        return None
+
+    return lookup
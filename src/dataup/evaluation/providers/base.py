@@ -50,6 +50,28 @@ class InferenceProvider(ABC):
             List of Label objects representing detections.
         """
 
+    def predict_batch(
+        self,
+        images: list[Image.Image],
+        *,
+        conf: float = 0.25,
+        iou: float = 0.5,
+    ) -> list[list[Label]]:
+        """Run inference on several images.
+
+        The default implementation calls :meth:`predict` once per image.
+        Providers whose backend accepts batched input should override it.
+
+        Args:
+            images: PIL Images to run inference on.
+            conf: Confidence threshold for detections.
+            iou: IoU threshold for NMS.
+
+        Returns:
+            One list of Label objects per input image, in input order.
+        """
+        return [self.predict(image, conf=conf, iou=iou) for image in images]
+
     @property
     @abstractmethod
     def class_names(self) -> list[str]:
@@ -67,3 +89,17 @@ class InferenceProvider(ABC):
             True if a model is loaded, False otherwise.
         """
         return False
+
+    def close(self) -> None:
+        """Release resources held by the provider.
+
+        The default implementation does nothing. Providers that open
+        connections or other handles should override it.
+        """
+        return None
+
+    def __enter__(self) -> InferenceProvider:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import base64
+import io
 import os
 from typing import TYPE_CHECKING, Any
 
-from dataup.evaluation.providers.base import InferenceProvider
+import httpx
 from dataup_models.geom import BoundingBox
 from dataup_models.labels import Label
 
+from dataup.evaluation.providers.base import InferenceProvider
+
 if TYPE_CHECKING:
     from PIL import Image
 
 
+# Per-request timeout for the hosted inference endpoint, in seconds
+HOSTED_TIMEOUT = 30.0
+
+
 class RoboflowProvider(InferenceProvider):
     """Inference provider for Roboflow models.
 
@@ -38,6 +46,10 @@ class RoboflowProvider(InferenceProvider):
         self._model: Any | None = None
         self._class_names: list[str] = []
         self._project_name: str = ""
+        # Keep-alive client for the model's hosted endpoint; the roboflow SDK
+        # posts each image through a new connection
+        self._api_url: str | None = None
+        self._http: httpx.Client | None = None
 
     def load_model(self, weights: str) -> None:
         """Load a Roboflow model by project/version.
@@ -94,6 +106,10 @@ class RoboflowProvider(InferenceProvider):
         self._model = project.version(int(version)).model
         self._project_name = project_name
 
+        # Call the hosted endpoint directly when the SDK exposes it, so every
+        # image reuses one TLS connection instead of opening its own
+        self._api_url = getattr(self._model, "api_url", None)
+
         # Try to get class names from the model
         # Note: Roboflow models may have class names in different places
         if hasattr(self._model, "classes"):
@@ -124,30 +140,21 @@ class RoboflowProvider(InferenceProvider):
         if self._model is None:
             raise RuntimeError("No model loaded. Call load_model() first.")
 
-        # Roboflow expects a file path or numpy array
-        # Convert PIL Image to a format Roboflow accepts
-        import tempfile
-
-        import numpy as np
-
-        # Convert PIL to numpy array
-        img_array = np.array(image)
-
-        # Save temporarily for Roboflow (it works better with file paths)
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp_file:
-            image.save(tmp_file.name)
-            tmp_path = tmp_file.name
+        if self._api_url:
+            result = self._predict_hosted(image, conf)
+        else:
+            import numpy as np
 
-        try:
-            # Run inference
-            result = self._model.predict(tmp_path, confidence=int(conf * 100)).json()
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_path)
+            # Roboflow encodes numpy arrays in memory (as OpenCV BGR frames),
+            # which avoids writing and re-reading a temporary JPEG per image
+            img_array = np.ascontiguousarray(np.asarray(image.convert("RGB"))[:, :, ::-1])
+            result = self._model.predict(img_array, confidence=int(conf * 100)).json()
 
         labels: list[Label] = []
 
         # Process predictions
+        known_classes = set(self._class_names)
+        new_classes: list[str] = []
         predictions = result.get("predictions", [])
         for pred in predictions:
             # Roboflow returns center coordinates and dimensions
@@ -165,9 +172,10 @@ class RoboflowProvider(InferenceProvider):
             class_name = pred.get("class", "unknown")
             confidence = pred.get("confidence", 0.0)
 
-            # Update class names if we find new ones
-            if class_name not in self._class_names:
-                self._class_names.append(class_name)
+            # Collect class names we haven't seen before
+            if class_name not in known_classes:
+                known_classes.add(class_name)
+                new_classes.append(class_name)
 
             labels.append(
                 Label(
@@ -177,8 +185,25 @@ class RoboflowProvider(InferenceProvider):
                 )
             )
 
+        self._class_names.extend(new_classes)
         return labels
 
+    def _predict_hosted(self, image: Image.Image, conf: float) -> dict[str, Any]:
+        """POST a base64 JPEG to the hosted inference endpoint over the pooled client."""
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, format="JPEG")
+        # Opened on first use so the provider still works after close()
+        if self._http is None:
+            self._http = httpx.Client(timeout=HOSTED_TIMEOUT)
+        response = self._http.post(
+            self._api_url,
+            params={"api_key": self._api_key, "confidence": int(conf * 100)},
+            content=base64.b64encode(buffer.getvalue()),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        response.raise_for_status()
+        return response.json()
+
     @property
     def class_names(self) -> list[str]:
         """Return list of class names the model can detect.
@@ -196,3 +221,9 @@ class RoboflowProvider(InferenceProvider):
             True if a model is loaded, False otherwise.
         """
         return self._model is not None
+
+    def close(self) -> None:
+        """Close the pooled HTTP client used for hosted inference."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
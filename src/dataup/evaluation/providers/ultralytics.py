@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING, Any
 
 from dataup_models.geom import BoundingBox
@@ -25,10 +26,24 @@ class UltralyticsProvider(InferenceProvider):
         >>> labels = provider.predict(image, conf=0.25, iou=0.5)
     """
 
-    def __init__(self) -> None:
-        """Initialize the Ultralytics provider."""
+    def __init__(self, imgsz: int | tuple[int, int] | None = None, *, warmup: bool = True) -> None:
+        """Initialize the Ultralytics provider.
+
+        Args:
+            imgsz: Fixed inference size passed to every predict call. Set it
+                  when evaluation frames share one resolution so every batch
+                  is letterboxed to the same shape. Defaults to the size the
+                  model was trained with.
+            warmup: Run one throwaway prediction in load_model() so predictor
+                   setup and kernel selection happen at load time rather than
+                   on the first real image.
+        """
         self._model: Any | None = None
+        self._warmup = warmup
         self._class_names: list[str] = []
+        # Extra keyword arguments for model.predict; imgsz is only passed when
+        # set so the model's own default applies otherwise
+        self._predict_options: dict[str, Any] = {"imgsz": imgsz} if imgsz is not None else {}
 
     def load_model(self, weights: str) -> None:
         """Load a YOLO model from weights path.
@@ -52,6 +67,21 @@ class UltralyticsProvider(InferenceProvider):
         # Extract class names from the model
         self._class_names = list(self._model.names.values())
 
+        if self._warmup:
+            self._warm_up()
+
+    def _warm_up(self) -> None:
+        """Run a throwaway prediction on a blank frame."""
+        import numpy as np
+
+        imgsz = self._predict_options.get("imgsz", 640)
+        height, width = (imgsz, imgsz) if isinstance(imgsz, int) else imgsz
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        # Warm-up is best effort; a model that rejects the blank frame simply
+        # pays its setup cost on the first real prediction
+        with contextlib.suppress(Exception):
+            self._model.predict(source=blank, verbose=False, **self._predict_options)
+
     def predict(
         self,
         image: Image.Image,
@@ -81,39 +111,82 @@ class UltralyticsProvider(InferenceProvider):
             conf=conf,
             iou=iou,
             verbose=False,
+            **self._predict_options,
         )
 
-        labels: list[Label] = []
-
         # Process results (first result since we pass a single image)
         if results and len(results) > 0:
-            result = results[0]
-            boxes = result.boxes
-
-            if boxes is not None:
-                for box in boxes:
-                    # Get box coordinates (xyxy format)
-                    xyxy = box.xyxy[0].cpu().numpy()
-                    x1, y1, x2, y2 = xyxy
-
-                    # Convert to x, y, width, height format
-                    x = int(x1)
-                    y = int(y1)
-                    width = int(x2 - x1)
-                    height = int(y2 - y1)
-
-                    # Get confidence and class
-                    confidence = float(box.conf[0].cpu().numpy())
-                    class_id = int(box.cls[0].cpu().numpy())
-                    class_name = self._class_names[class_id]
-
-                    labels.append(
-                        Label(
-                            label=class_name,
-                            score=confidence,
-                            bbox=BoundingBox(x=x, y=y, width=width, height=height),
-                        )
+            return self._result_to_labels(results[0])
+        return []
+
+    def predict_batch(
+        self,
+        images: list[Image.Image],
+        *,
+        conf: float = 0.25,
+        iou: float = 0.5,
+    ) -> list[list[Label]]:
+        """Run inference on several images in a single model call.
+
+        Args:
+            images: PIL Images to run inference on.
+            conf: Confidence threshold for detections.
+            iou: IoU threshold for NMS.
+
+        Returns:
+            One list of Label objects per input image, in input order.
+
+        Raises:
+            RuntimeError: If no model is loaded.
+        """
+        if self._model is None:
+            raise RuntimeError("No model loaded. Call load_model() first.")
+        if not images:
+            return []
+
+        # Ultralytics accepts a list source and yields one result per image.
+        # Streaming lets each Results (which holds the original frame array)
+        # be dropped as soon as its labels are built.
+        results = self._model.predict(
+            source=images,
+            conf=conf,
+            iou=iou,
+            batch=len(images),
+            verbose=False,
+            stream=True,
+            **self._predict_options,
+        )
+        return [self._result_to_labels(result) for result in results]
+
+    def _result_to_labels(self, result: Any) -> list[Label]:
+        """Convert a single Ultralytics result into Label objects."""
+        labels: list[Label] = []
+        boxes = result.boxes
+
+        if boxes is not None and len(boxes):
+            # Copy each tensor off the device once per image, not once per box,
+            # and iterate plain Python numbers rather than numpy scalars
+            xyxy = boxes.xyxy.cpu().numpy().tolist()
+            confidences = boxes.conf.cpu().numpy().tolist()
+            class_ids = boxes.cls.cpu().numpy().astype(int).tolist()
+            class_names = self._class_names
+
+            for (x1, y1, x2, y2), confidence, class_id in zip(
+                xyxy, confidences, class_ids, strict=True
+            ):
+                # Convert to x, y, width, height format
+                x = int(x1)
+                y = int(y1)
+                width = int(x2 - x1)
+                height = int(y2 - y1)
+
+                labels.append(
+                    Label(
+                        label=class_names[class_id],
+                        score=confidence,
+                        bbox=BoundingBox(x=x, y=y, width=width, height=height),
                     )
+                )
 
         return labels
 
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import io
-from typing import TYPE_CHECKING, Callable
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
 
 from PIL import Image
 
@@ -18,8 +22,78 @@ from dataup.models.evaluations import (
 if TYPE_CHECKING:
     from dataup.client import DataUpClient
     from dataup.cvat import CVATClient
+    from dataup.cvat.models.frames import FrameImage
     from dataup.evaluation.providers.base import InferenceProvider
 
+T = TypeVar("T")
+
+# Decoded frames kept ready ahead of inference
+DEFAULT_PREFETCH_FRAMES = 4
+# Batch uploads queued behind inference before the runner waits for one
+MAX_PENDING_INGESTS = 2
+# Upper bound on the estimated size of one ingest request body
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024
+# Rough serialized size of one Label, used to estimate request sizes
+LABEL_BYTES_ESTIMATE = 200
+
+_DONE = object()
+
+
+def _prefetch(items: Iterable[T], size: int = DEFAULT_PREFETCH_FRAMES) -> Iterator[T]:
+    """Consume ``items`` on a background thread, keeping up to ``size`` ready.
+
+    Exceptions raised while producing items are re-raised in the consumer.
+    Stopping early signals the producer thread to exit and waits for it.
+    """
+    buffer: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(entry: tuple[Any, BaseException | None]) -> bool:
+        # Give up once the consumer has gone away rather than blocking forever
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception as exc:
+            put((_DONE, exc))
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        put((_DONE, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _decode_frame(frame_image: FrameImage) -> tuple[int, Image.Image]:
+    """Decode a frame's image bytes into a fully loaded PIL image."""
+    pil_image = Image.open(io.BytesIO(frame_image.data))
+    pil_image.load()
+    return frame_image.frame_id, pil_image
+
 
 class EvaluationRunner:
     """Orchestrates evaluation creation and submission.
@@ -77,6 +151,7 @@ class EvaluationRunner:
         conf: float = 0.0,
         iou: float = 0.5,
         batch_size: int = 10,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
         progress_callback: Callable[[int, int], None] | None = None,
     ) -> EvaluationRead:
         """Run evaluation on a CVAT task and submit to DataUp.
@@ -100,24 +175,29 @@ class EvaluationRunner:
                     If None, processes all jobs in the task.
             conf: Confidence threshold for inference.
             iou: IoU threshold for NMS during inference.
-            batch_size: Number of frames to process before sending to API.
+            batch_size: Number of frames per inference call and per API submission.
+            max_batch_bytes: Estimated body size at which a submission is split,
+                            so frames with many labels don't produce oversized
+                            requests.
             progress_callback: Optional callback function called with
                              (current_frame, total_frames) for progress updates.
 
         Returns:
             EvaluationRead object with computed COCO metrics.
         """
-        # First pass: calculate total frames for progress tracking and filter jobs
-        total_frames = 0
+        # Count frames for progress tracking from the task's job list and data
+        # meta; annotations are only downloaded once, in the processing pass
         jobs_to_process_ids: set[int] | None = set(job_ids) if job_ids is not None else None
+        task = self._cvat.tasks.get(task_id)
+        deleted_frames = self._cvat.tasks.get_data_meta(task_id).deleted_frames
 
-        for job_summary, _ in self._cvat.jobs.iter_jobs_with_annotations(task_id):
+        total_frames = 0
+        for job_summary in task.jobs:
             if jobs_to_process_ids is not None and job_summary.id not in jobs_to_process_ids:
                 continue
-            job = self._cvat.jobs.get(job_summary.id)
-            meta = self._cvat.jobs.get_data_meta(job_summary.id)
-            frame_count = job.stop_frame - job.start_frame + 1 - len(meta.deleted_frames)
-            total_frames += frame_count
+            start, stop = job_summary.start_frame, job_summary.stop_frame
+            deleted_in_job = sum(1 for frame in deleted_frames if start <= frame <= stop)
+            total_frames += stop - start + 1 - deleted_in_job
 
         # Create the evaluation
         create_response = self._dataup.evaluations.create(
@@ -134,8 +214,71 @@ class EvaluationRunner:
 
         # Process frames and submit in batches
         processed_frames = 0
-        current_batch: list[FrameData] = []
+        pending_frames: list[tuple[int, int, Image.Image, list]] = []
+        # Uploads run on one background thread so inference never waits on a POST
+        ingest_pool = ThreadPoolExecutor(max_workers=1)
+        pending_ingests: deque[Future[None]] = deque()
+
+        def queue_ingest(frames: list[FrameData]) -> None:
+            # Apply back-pressure (and surface upload errors) once enough
+            # batches are queued
+            if len(pending_ingests) >= MAX_PENDING_INGESTS:
+                pending_ingests.popleft().result()
+            pending_ingests.append(
+                ingest_pool.submit(
+                    self._dataup.evaluations.ingest_batch,
+                    evaluation_id,
+                    BatchIngestRequest.model_construct(frames=frames),
+                )
+            )
+
+        def submit_pending() -> None:
+            # One model call per batch, then ingest the same frames, split
+            # further only when their labels would make the request too large
+            nonlocal processed_frames
+            images = [pil_image for _, _, pil_image, _ in pending_frames]
+            batch_predictions = self._provider.predict_batch(images, conf=conf, iou=iou)
+
+            # Keep only the sizes so decoded pixels are freed before this
+            # thread can block waiting on an upload
+            batch_frames = [
+                (job_id, frame_id, pil_image.size, ground_truth)
+                for job_id, frame_id, pil_image, ground_truth in pending_frames
+            ]
+            pending_frames.clear()
+            del images
+
+            frames: list[FrameData] = []
+            frames_bytes = 0
+            for (job_id, frame_id, (width, height), ground_truth), predictions in zip(
+                batch_frames, batch_predictions, strict=True
+            ):
+                frame_bytes = (len(ground_truth) + len(predictions)) * LABEL_BYTES_ESTIMATE
+                if frames and frames_bytes + frame_bytes > max_batch_bytes:
+                    queue_ingest(frames)
+                    frames = []
+                    frames_bytes = 0
+
+                # Labels were already validated by the provider and the CVAT
+                # client, so skip re-validating them for every frame
+                frames.append(
+                    FrameData.model_construct(
+                        job_id=job_id,
+                        frame_id=frame_id,
+                        ground_truth=ground_truth,
+                        predictions=predictions,
+                        image_width=width,
+                        image_height=height,
+                    )
+                )
+                frames_bytes += frame_bytes
+                processed_frames += 1
+                if progress_callback:
+                    progress_callback(processed_frames, total_frames)
+
+            queue_ingest(frames)
 
+        decoded_frames: Iterator[tuple[int, Image.Image]] | None = None
         try:
             # Second pass: process frames using iterators
             for job_summary, frame_labels_list in self._cvat.jobs.iter_jobs_with_annotations(
@@ -148,51 +291,32 @@ class EvaluationRunner:
                     continue
 
                 # Build frame_id -> labels lookup from FrameLabels
-                frame_labels_lookup: dict[int, list] = {}
-                for frame_labels in frame_labels_list:
-                    frame_labels_lookup[frame_labels.frame_id] = frame_labels.labels
-
-                # Iterate through frames using iter_frames
-                for frame_image in self._cvat.jobs.iter_frames(job_id):
-                    frame_id = frame_image.frame_id
-
-                    # Convert bytes to PIL Image
-                    pil_image = Image.open(io.BytesIO(frame_image.data))
-
-                    # Run inference
-                    predictions = self._provider.predict(pil_image, conf=conf, iou=iou)
-
+                frame_labels_lookup: dict[int, list] = {
+                    frame_labels.frame_id: frame_labels.labels for frame_labels in frame_labels_list
+                }
+
+                # Download and decode upcoming frames on a background thread
+                # while the current batch runs through the model
+                decoded_frames = _prefetch(
+                    _decode_frame(frame_image)
+                    for frame_image in self._cvat.jobs.iter_frames(job_id)
+                )
+                for frame_id, pil_image in decoded_frames:
                     # Get ground truth labels (already converted from CVAT annotations)
                     ground_truth = frame_labels_lookup.get(frame_id, [])
-                    # Create frame data
-                    frame_data = FrameData(
-                        job_id=job_id,
-                        frame_id=frame_id,
-                        ground_truth=ground_truth,
-                        predictions=predictions,
-                        image_width=pil_image.width,
-                        image_height=pil_image.height,
-                    )
-                    current_batch.append(frame_data)
+                    pending_frames.append((job_id, frame_id, pil_image, ground_truth))
 
-                    processed_frames += 1
-                    if progress_callback:
-                        progress_callback(processed_frames, total_frames)
-
-                    # Submit batch when full
-                    if len(current_batch) >= batch_size:
-                        self._dataup.evaluations.ingest_batch(
-                            evaluation_id,
-                            BatchIngestRequest(frames=current_batch),
-                        )
-                        current_batch = []
+                    # Run inference and submit when the batch is full
+                    if len(pending_frames) >= batch_size:
+                        submit_pending()
 
             # Submit any remaining frames
-            if current_batch:
-                self._dataup.evaluations.ingest_batch(
-                    evaluation_id,
-                    BatchIngestRequest(frames=current_batch),
-                )
+            if pending_frames:
+                submit_pending()
+
+            # Every batch must be ingested before finalizing
+            while pending_ingests:
+                pending_ingests.popleft().result()
 
             # Finalize the evaluation
             self._dataup.evaluations.finalize(evaluation_id)
@@ -200,7 +324,13 @@ class EvaluationRunner:
             # Return the complete evaluation with metrics
             return self._dataup.evaluations.get(evaluation_id)
 
-        except Exception:
-            # If something goes wrong, the evaluation will be in a failed state
-            # Re-raise the exception for the caller to handle
-            raise
+        finally:
+            # On failure the evaluation is left unfinalized and the exception
+            # propagates. Stop the frame prefetch thread now rather than when
+            # the traceback is released, drop uploads that haven't started,
+            # and wait for the one in progress.
+            if decoded_frames is not None:
+                decoded_frames.close()
+            for future in pending_ingests:
+                future.cancel()
+            ingest_pool.shutdown(wait=True)
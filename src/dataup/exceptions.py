@@ -69,3 +69,14 @@ class TimeoutError(DataUpError):
     """Request timeout error."""
 
     pass
+
+
+# HTTP status code -> exception class raised for it (others raise DataUpAPIError)
+_STATUS_EXCEPTIONS: dict[int, type[DataUpAPIError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: PermissionDeniedError,
+    404: NotFoundError,
+    409: ConflictError,
+    429: RateLimitError,
+}
@@ -23,10 +23,20 @@ class Polygon(BaseModel, frozen=True):
 
     def to_bbox(self) -> BoundingBox:
         """Convert polygon to bounding box."""
-        x_coords = [x for x, y in self.points]
-        y_coords = [y for x, y in self.points]
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
+        if not self.points:
+            raise ValueError("Cannot compute the bounding box of an empty polygon")
+        # Single pass tracking the extremes instead of building coordinate lists
+        points = iter(self.points)
+        x_min, y_min = x_max, y_max = next(points)
+        for x, y in points:
+            if x < x_min:
+                x_min = x
+            elif x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
         return BoundingBox(x=x_min, y=y_min, width=x_max - x_min, height=y_max - y_min)
 
 
@@ -97,7 +107,9 @@ class DetectionResults(BaseModel):
 class InferenceResponse(BaseModel):
     """Inference response schema."""
 
-    data: list[DetectionResults] | dict[str, Any]
+    # List and dict inputs never overlap, so try the common list branch first
+    # instead of smart-mode scoring both branches on every response
+    data: list[DetectionResults] | dict[str, Any] = Field(union_mode="left_to_right")
     success: bool = True
     session_id: str | None = Field(default=None, description="Session ID")
     error: str = ""
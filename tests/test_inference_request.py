@@ -0,0 +1,32 @@
+"""Tests for inference request serialization."""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from dataup import DataUpClient
+from dataup.models.inference import InferenceRequest, SAM3Params
+
+pytest.importorskip("orjson")
+
+
+def test_infer_sends_geom_prompt_with_non_json_values() -> None:
+    sent: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200, json={"data": []})
+
+    request = InferenceRequest(
+        images_b64=["aGVsbG8="],
+        params=SAM3Params(geom_prompt={"scale": Decimal("1.5"), "points": {3}}),
+    )
+    with DataUpClient("key.secret", transport=httpx.MockTransport(handler)) as client:
+        client.agents.infer("agent-1", request)
+
+    assert sent[0]["images_b64"] == ["aGVsbG8="]
+    assert sent[0]["params"]["geom_prompt"] == {"scale": "1.5", "points": [3]}